@@ -14,6 +14,7 @@
 
 #include "bindings.h"
 #include "class_wrapper.h"
+#include "numpy_helpers.h"
 
 using namespace pybind11::literals;
 
@@ -65,10 +66,12 @@ void exportInitialConditions(py::module& m)
         according to the template .xyz file and then the objects will be translated/rotated according to the provided initial conditions.
             
     )")
-        .def(py::init<PyTypes::VectorOfFloat7, std::string>(), "com_q"_a, "xyz_filename"_a, R"(
+        .def(py::init([] (const ContiguousArray<float>& com_q, std::string xyzfname) {
+                return std::make_shared<RigidIC>(arrayToVectorOfN<float, 7>(com_q, "com_q"), xyzfname);
+            }), "com_q"_a, "xyz_filename"_a, R"(
             Args:
                 com_q:
-                    List describing location and rotation of the created objects.               
+                    List or array of shape (n, 7) describing location and rotation of the created objects.
                     One entry in the list corresponds to one object created.                          
                     Each entry consist of 7 floats: *<com_x> <com_y> <com_z>  <q_x> <q_y> <q_z> <q_w>*, where    
                     *com* is the center of mass of the object, *q* is the quaternion of its rotation,
@@ -80,36 +83,43 @@ void exportInitialConditions(py::module& m)
                     The number of particles in the file must be the same as in number of particles per object
                     in the corresponding PV
         )")
-        .def(py::init<PyTypes::VectorOfFloat7, const PyTypes::VectorOfFloat3&>(), "com_q"_a, "coords"_a, R"(
+        .def(py::init([] (const ContiguousArray<float>& com_q, const ContiguousArray<float>& coords) {
+                return std::make_shared<RigidIC>(arrayToVectorOfN<float, 7>(com_q,  "com_q"),
+                                                 arrayToVectorOfN<float, 3>(coords, "coords"));
+            }), "com_q"_a, "coords"_a, R"(
             Args:
                 com_q:
-                    List describing location and rotation of the created objects.               
+                    List or array of shape (n, 7) describing location and rotation of the created objects.
                     One entry in the list corresponds to one object created.                          
                     Each entry consist of 7 floats: *<com_x> <com_y> <com_z>  <q_x> <q_y> <q_z> <q_w>*, where    
                     *com* is the center of mass of the object, *q* is the quaternion of its rotation,
                     not necessarily normalized 
                 coords:
                     Template that describes the positions of the body particles before translation or        
-                    rotation is applied.       
+                    rotation is applied, list or array of shape (n, 3).
                     The number of coordinates must be the same as in number of particles per object
                     in the corresponding PV
         )")
-        .def(py::init<PyTypes::VectorOfFloat7, const PyTypes::VectorOfFloat3&, const PyTypes::VectorOfFloat3&>(),
-             "com_q"_a, "coords"_a, "init_vels"_a, R"(
+        .def(py::init([] (const ContiguousArray<float>& com_q, const ContiguousArray<float>& coords,
+                          const ContiguousArray<float>& init_vels) {
+                return std::make_shared<RigidIC>(arrayToVectorOfN<float, 7>(com_q,     "com_q"),
+                                                 arrayToVectorOfN<float, 3>(coords,    "coords"),
+                                                 arrayToVectorOfN<float, 3>(init_vels, "init_vels"));
+            }), "com_q"_a, "coords"_a, "init_vels"_a, R"(
             Args:
                 com_q:
-                    List describing location and rotation of the created objects.               
+                    List or array of shape (n, 7) describing location and rotation of the created objects.
                     One entry in the list corresponds to one object created.                          
                     Each entry consist of 7 floats: *<com_x> <com_y> <com_z>  <q_x> <q_y> <q_z> <q_w>*, where    
                     *com* is the center of mass of the object, *q* is the quaternion of its rotation,
                     not necessarily normalized 
                 coords:
                     Template that describes the positions of the body particles before translation or        
-                    rotation is applied.       
+                    rotation is applied, list or array of shape (n, 3).
                     The number of coordinates must be the same as in number of particles per object
                     in the corresponding PV
-                com_q:
-                    List specifying initial Center-Of-Mass velocities of the bodies.               
+                init_vels:
+                    List or array of shape (n, 3) specifying initial Center-Of-Mass velocities of the bodies.
                     One entry (list of 3 floats) in the list corresponds to one object 
         )");
     
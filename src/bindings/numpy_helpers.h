@@ -0,0 +1,56 @@
+#pragma once
+
+#include "bindings.h"
+
+#include <core/logger.h>
+#include <core/utils/pytypes.h>
+
+#include <pybind11/numpy.h>
+
+#include <cstring>
+#include <string>
+
+/// Array with C layout; anything convertible (lists, arrays of other types) is cast on the fly
+template <typename T>
+using ContiguousArray = py::array_t<T, py::array::c_style | py::array::forcecast>;
+
+/**
+ * Copy an array of shape (n, N) into a vector of n entries of N elements each.
+ * The data is copied at once instead of converting every element separately.
+ *
+ * @param arr source array
+ * @param name name of the argument, used to report errors
+ */
+template <typename T, int N>
+PyTypes::VectorOfTypeN<T, N> arrayToVectorOfN(const ContiguousArray<T>& arr, std::string name)
+{
+    PyTypes::VectorOfTypeN<T, N> res;
+
+    if (arr.size() == 0) return res;
+
+    if (arr.ndim() != 2 || arr.shape(1) != N)
+        die("Argument '%s' must be an array of shape (n, %d)", name.c_str(), N);
+
+    res.resize(arr.shape(0));
+    memcpy(res.data(), arr.data(), arr.size() * sizeof(T));
+
+    return res;
+}
+
+/**
+ * Copy a vector of n entries of N elements each into a new array of shape (n, N).
+ * The elements are converted to \p Tout, e.g. to double to get the same values
+ * as the Python floats of a list.
+ */
+template <typename Tout, typename T, int N>
+py::array_t<Tout> vectorOfNToArray(const PyTypes::VectorOfTypeN<T, N>& v)
+{
+    py::array_t<Tout> res({(py::ssize_t) v.size(), (py::ssize_t) N});
+    auto dst = res.mutable_unchecked<2>();
+
+    for (size_t i = 0; i < v.size(); i++)
+        for (int d = 0; d < N; d++)
+            dst(i, d) = v[i][d];
+
+    return res;
+}
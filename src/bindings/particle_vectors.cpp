@@ -1,5 +1,6 @@
 #include "bindings.h"
 #include "class_wrapper.h"
+#include "numpy_helpers.h"
 
 #include <core/mesh/membrane.h>
 #include <core/mesh/mesh.h>
@@ -32,17 +33,23 @@ void exportParticleVectors(py::module& m)
             Returns:
                 A list of unique integer particle identifiers
         )")
-        .def("getCoordinates", &ParticleVector::getCoordinates_vector, R"(
+        .def("getCoordinates", [] (ParticleVector *pv) {
+                return vectorOfNToArray<double>(pv->getCoordinates_vector());
+            }, R"(
             Returns: 
-                A list of :math:`N \times 3` floats: 3 components of coordinate for every of the N particles
+                An array of shape :math:`N \times 3`: 3 components of coordinate for every of the N particles
         )")
-        .def("getVelocities",  &ParticleVector::getVelocities_vector, R"(
+        .def("getVelocities",  [] (ParticleVector *pv) {
+                return vectorOfNToArray<double>(pv->getVelocities_vector());
+            }, R"(
             Returns: 
-                A list of :math:`N \times 3` floats: 3 components of velocity for every of the N particles
+                An array of shape :math:`N \times 3`: 3 components of velocity for every of the N particles
         )")
-        .def("getForces",      &ParticleVector::getForces_vector, R"(
+        .def("getForces",      [] (ParticleVector *pv) {
+                return vectorOfNToArray<double>(pv->getForces_vector());
+            }, R"(
             Returns: 
-                A list of :math:`N \times 3` floats: 3 components of force for every of the N particles
+                An array of shape :math:`N \times 3`: 3 components of force for every of the N particles
         )")
         //
         .def("setCoordinates", &ParticleVector::setCoordinates_vector, "coordinates"_a, R"(
@@ -68,12 +75,15 @@ void exportParticleVectors(py::module& m)
         Args:
             off_filename: path of the OFF file
     )")
-        .def(py::init<const PyTypes::VectorOfFloat3&, const PyTypes::VectorOfInt3&>(), "vertices"_a, "faces"_a, R"(
+        .def(py::init([] (const ContiguousArray<float>& vertices, const ContiguousArray<int>& faces) {
+                return std::make_shared<Mesh>(arrayToVectorOfN<float, 3>(vertices, "vertices"),
+                                              arrayToVectorOfN<int,   3>(faces,    "faces"));
+            }), "vertices"_a, "faces"_a, R"(
         Create a mesh by giving coordinates and connectivity
         
         Args:
-            vertices: vertex coordinates
-            faces:    connectivity: one triangle per entry, each integer corresponding to the vertex indices
+            vertices: vertex coordinates, list or array of shape (nvertices, 3)
+            faces:    connectivity: one triangle per entry, each integer corresponding to the vertex indices; list or array of shape (nfaces, 3)
         
     )")
         .def("getVertices", &Mesh::getVertices, R"(
@@ -103,21 +113,28 @@ void exportParticleVectors(py::module& m)
                 off_initial_mesh: path of the OFF file : initial mesh
                 off_stress_free_mesh: path of the OFF file : stress-free mesh)
         )")
-        .def(py::init<const PyTypes::VectorOfFloat3&, const PyTypes::VectorOfInt3&>(), "vertices"_a, "faces"_a, R"(
+        .def(py::init([] (const ContiguousArray<float>& vertices, const ContiguousArray<int>& faces) {
+                return std::make_shared<MembraneMesh>(arrayToVectorOfN<float, 3>(vertices, "vertices"),
+                                                      arrayToVectorOfN<int,   3>(faces,    "faces"));
+            }), "vertices"_a, "faces"_a, R"(
         Create a mesh by giving coordinates and connectivity
         
         Args:
-            vertices: vertex coordinates
-            faces:    connectivity: one triangle per entry, each integer corresponding to the vertex indices
+            vertices: vertex coordinates, list or array of shape (nvertices, 3)
+            faces:    connectivity: one triangle per entry, each integer corresponding to the vertex indices; list or array of shape (nfaces, 3)
         )")
-        .def(py::init<const PyTypes::VectorOfFloat3&, const PyTypes::VectorOfFloat3&, const PyTypes::VectorOfInt3&>(),
-             "vertices"_a, "stress_free_vertices"_a, "faces"_a, R"(
+        .def(py::init([] (const ContiguousArray<float>& vertices, const ContiguousArray<float>& stressFreeVertices,
+                          const ContiguousArray<int>& faces) {
+                return std::make_shared<MembraneMesh>(arrayToVectorOfN<float, 3>(vertices,           "vertices"),
+                                                      arrayToVectorOfN<float, 3>(stressFreeVertices, "stress_free_vertices"),
+                                                      arrayToVectorOfN<int,   3>(faces,              "faces"));
+            }), "vertices"_a, "stress_free_vertices"_a, "faces"_a, R"(
         Create a mesh by giving coordinates and connectivity, with a different stress-free shape.
         
         Args:
-            vertices: vertex coordinates
-            stress_free_vertices: vertex coordinates of the stress-free shape
-            faces:    connectivity: one triangle per entry, each integer corresponding to the vertex indices
+            vertices: vertex coordinates, list or array of shape (nvertices, 3)
+            stress_free_vertices: vertex coordinates of the stress-free shape, same shape as ``vertices``
+            faces:    connectivity: one triangle per entry, each integer corresponding to the vertex indices; list or array of shape (nfaces, 3)
     )");
 
         
@@ -484,6 +484,9 @@ void exportPlugins(py::module& m)
             channels: list of pairs name - type.
                 Name is the channel (per particle) name.
                 The "velocity" and "id" channels are always activated.
+                If no channel "forces" was created by another plugin (e.g. :any:`ForceSaver`),
+                the "forces" channel holds the total forces acting on the dumped particles.
+                All the data is then taken before the integration of the step preceding the dump.
                 Type is to provide the type of quantity to extract from the channel.                                            
                 Available types are:                                                                             
                                                                                                                 
@@ -506,6 +509,9 @@ void exportPlugins(py::module& m)
             channels: list of pairs name - type.
                 Name is the channel (per particle) name.
                 The "velocity" and "id" channels are always activated.
+                If no channel "forces" was created by another plugin (e.g. :any:`ForceSaver`),
+                the "forces" channel holds the total forces acting on the dumped particles.
+                All the data is then taken before the integration of the step preceding the dump.
                 Type is to provide the type of quantity to extract from the channel.                                            
                 Available types are:                                                                             
                                                                                                                 
@@ -29,14 +29,19 @@ void exportYmero(py::module& m)
     )")
         .def(py::init( [] (PyTypes::int3 nranks, PyTypes::float3 domain, float dt,
                            std::string log, int debuglvl, int checkpoint,
-                           std::string restart, bool cudaMPI, bool noSplash, long comm) {
+                           std::string restart, bool cudaMPI, bool noSplash, long comm, std::string loadBalance,
+                           size_t poolInitial, size_t poolMax, bool fuseInteractions, bool filterHalo) {
 
-                if (comm == 0) return std::make_unique<YMeRo> (      nranks, domain, dt, log, debuglvl, checkpoint, restart, cudaMPI, noSplash);
-                else           return std::make_unique<YMeRo> (comm, nranks, domain, dt, log, debuglvl, checkpoint, restart, cudaMPI, noSplash);
+                if (comm == 0) return std::make_unique<YMeRo> (      nranks, domain, dt, log, debuglvl, checkpoint, restart, cudaMPI, noSplash,
+                                                                      loadBalance, poolInitial, poolMax, fuseInteractions, filterHalo);
+                else           return std::make_unique<YMeRo> (comm, nranks, domain, dt, log, debuglvl, checkpoint, restart, cudaMPI, noSplash,
+                                                                      loadBalance, poolInitial, poolMax, fuseInteractions, filterHalo);
             } ),
             py::return_value_policy::take_ownership,
             "nranks"_a, "domain"_a, "dt"_a, "log_filename"_a="log", "debug_level"_a=3, "checkpoint_every"_a=0,
-            "restart_folder"_a="restart/", "cuda_aware_mpi"_a=false, "no_splash"_a=false, "comm_ptr"_a=0, R"(
+            "restart_folder"_a="restart/", "cuda_aware_mpi"_a=false, "no_splash"_a=false, "comm_ptr"_a=0,
+            "load_balance"_a="uniform", "gpu_pool_initial_bytes"_a=0, "gpu_pool_max_bytes"_a=0,
+            "fuse_interactions"_a=false, "filter_halo"_a=false, R"(
                 Create the YMeRo coordinator.
                 
                 .. warning::
@@ -56,7 +61,7 @@ void exportYmero(py::module& m)
                 
                 Args:
                     nranks: number of MPI simulation tasks per axis: x,y,z. If postprocess is enabled, the same number of the postprocess tasks will be running
-                    domain: size of the simulation domain in x,y,z. Periodic boundary conditions are applied at the domain boundaries. The domain will be split in equal chunks between the MPI ranks.
+                    domain: size of the simulation domain in x,y,z. Periodic boundary conditions are applied at the domain boundaries. The domain will be split in equal chunks between the MPI ranks, unless load balancing is enabled.
                         The largest chunk size that a single MPI rank can have depends on the total number of particles,
                         handlers and hardware, and is typically about :math:`120^3 - 200^3`.
                     dt: timestep of the simulation
@@ -73,6 +78,23 @@ void exportYmero(py::module& m)
                     cuda_aware_mpi: enable CUDA Aware MPI. The MPI library must support that feature, otherwise it may fail.
                     no_splash: don't display the splash screen when at the start-up.
                     comm_ptr: pointer to communicator. By default MPI_COMM_WORLD will be used
+                    load_balance: domain decomposition strategy, one of:
+
+                        * **uniform**: all the subdomains have the same size
+                        * **orb**: the subdomain boundaries are moved before the first run, such that all the ranks hold approximately the same number of particles.
+                          The subdomains remain aligned on a cartesian grid. Not supported together with walls or with the plugins that require uniform decomposition
+                    gpu_pool_initial_bytes: size of the device memory pool allocated at start-up.
+                        All the device buffers are then sub-allocated from the pool instead of calling ``cudaMalloc`` every time they grow,
+                        which avoids fragmentation of the device memory.
+                        The pool is disabled if both this and ``gpu_pool_max_bytes`` are 0 (default)
+                    gpu_pool_max_bytes: maximum size the pool may grow to, 0 means no limit
+                    fuse_interactions: if True, the local interactions of a particle vector with several other particle vectors
+                        that use the same interaction object (possibly with pair-specific parameters) are computed by a single kernel.
+                        The particles of the first particle vector are then read and updated only once.
+                        The forces are the same up to the round-off, since they are summed in a different order
+                    filter_halo: if True, only the particles that are within the cutoff radius of the neighbouring subdomain are sent in the halo exchange,
+                        instead of all the particles of the boundary cells. This reduces the amount of exchanged data, mostly for the edge and corner neighbours.
+                        The results are the same up to the round-off, since the halo particles are arranged in a different order
         )")
         
         .def("registerParticleVector", &YMeRo::registerParticleVector,
@@ -127,13 +149,18 @@ void exportYmero(py::module& m)
         )")        
 
         .def("computeVolumeInsideWalls", &YMeRo::computeVolumeInsideWalls,
-            "walls"_a, "nSamplesPerRank"_a=100000, R"(
+            "walls"_a, "nSamplesPerRank"_a=100000, "method"_a="mc", R"(
                 Compute the volume inside the given walls in the whole domain (negative values are the 'inside' of the simulation).
-                The computation is made via simple Monte-Carlo.
+                The computation is made via Monte-Carlo or quasi Monte-Carlo integration.
                 
                 Args:
                     walls: sdf based walls
-                    nSamplesPerRank: number of Monte-Carlo samples used per rank
+                    nSamplesPerRank: number of samples used per rank
+                    method: how the samples are drawn:
+                    
+                        * **mc**: pseudo-random samples, the error decreases as :math:`1/\sqrt{N}`
+                        * **sobol**: Sobol low-discrepancy sequence with a random digital shift, the error decreases almost as :math:`1/N`,
+                          so that much fewer samples are needed for the same accuracy
         )")        
         
         .def("applyObjectBelongingChecker",    &YMeRo::applyObjectBelongingChecker,
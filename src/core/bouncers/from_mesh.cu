@@ -153,7 +153,7 @@ void BounceFromMesh::exec(ParticleVector *pv, CellList *cl, bool local, cudaStre
 
         SAFE_KERNEL_LAUNCH(
                 RigidIntegrationKernels::collectRigidForces,
-                getNblocks(view.size, 128), 128, 0, stream,
+                view.nObjects, 128, 0, stream,
                 view );
     }
 }
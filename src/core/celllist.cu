@@ -2,6 +2,7 @@
 #include <core/pvs/views/pv.h>
 #include <core/pvs/object_vector.h>
 #include <core/celllist.h>
+#include <core/utils/common.h>
 #include <core/utils/cuda_common.h>
 #include <core/utils/kernel_launch.h>
 #include <core/utils/typeMap.h>
@@ -104,6 +105,26 @@ __global__ void accumulateKernel(int n, T *dst, CellListInfo cinfo, const T *src
     dst[pid] += src[srcId];
 }
 
+__global__ void computeCompactPositions(PVviewWithCompactPositions view)
+{
+    const int pid = blockIdx.x * blockDim.x + threadIdx.x;
+    if (pid >= view.size) return;
+
+    Particle p;
+    p.readCoordinate(view.particles, pid);
+
+    const float3 s = (p.r - view.compactOrigin) / view.compactStep;
+
+    // NaN fails the comparisons as well
+    const bool inside = s.x >= 0.0f && s.x <= PVviewWithCompactPositions::maxCode &&
+                        s.y >= 0.0f && s.y <= PVviewWithCompactPositions::maxCode &&
+                        s.z >= 0.0f && s.z <= PVviewWithCompactPositions::maxCode;
+
+    view.compactPositions[pid] = inside ?
+        make_ushort4(__float2uint_rn(s.x), __float2uint_rn(s.y), __float2uint_rn(s.z), 0) :
+        make_ushort4(0, 0, 0, 1);
+}
+
 } // namespace CellListKernels
 
 //=================================================================================
@@ -330,6 +351,25 @@ void CellList::_build(cudaStream_t stream)
     changedStamp = pv->cellListStamp;
 }
 
+/**
+ * Encode the reordered positions if an interaction requested them
+ * (see PVviewWithCompactPositions). Doing it here, on the stream of the build,
+ * keeps them in sync with the positions for all the tasks using the cell-list
+ */
+void CellList::_computeCompactPositions(cudaStream_t stream)
+{
+    if (!localPV->extraPerParticle.checkChannelExists(ChannelNames::compactPositions))
+        return;
+
+    PVviewWithCompactPositions view(pv, localPV);
+
+    const int nthreads = 128;
+    SAFE_KERNEL_LAUNCH(
+            CellListKernels::computeCompactPositions,
+            getNblocks(view.size, nthreads), nthreads, 0, stream,
+            view );
+}
+
 CellListInfo CellList::cellInfo()
 {
     CellListInfo::cellSizes  = cellSizes.devPtr();
@@ -348,6 +388,7 @@ void CellList::build(cudaStream_t stream)
     debug("building %s", makeName().c_str());
     
     _build(stream);
+    _computeCompactPositions(stream);
 }
 
 void CellList::_accumulateForces(cudaStream_t stream)
@@ -464,7 +505,11 @@ void PrimaryCellList::build(cudaStream_t stream)
 	// Reqired here to avoid ptr swap if building didn't actually happen
     if (!_checkNeedBuild()) return;
 
-    CellList::build(stream);
+    _updateExtraDataChannels(stream);
+
+    debug("building %s", makeName().c_str());
+
+    _build(stream);
 
     if (pv->local()->size() == 0)
     {
@@ -486,6 +531,8 @@ void PrimaryCellList::build(cudaStream_t stream)
     _swapPersistentExtraData();
     
     pv->local()->resize(newSize, stream);
+
+    _computeCompactPositions(stream);
 }
 
 void PrimaryCellList::accumulateChannels(const std::vector<std::string>& channelNames, cudaStream_t stream)
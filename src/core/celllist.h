@@ -143,6 +143,7 @@ protected:
     void _reorderPersistentData(cudaStream_t stream);
     
     void _build(cudaStream_t stream);
+    void _computeCompactPositions(cudaStream_t stream);
         
     void _accumulateForces(cudaStream_t stream);
     void _accumulateExtraData(const std::string& channelName, cudaStream_t stream);
@@ -1,6 +1,7 @@
 #pragma once
 
 #include <core/logger.h>
+#include <core/utils/memory_pool.h>
 
 #include <cstring>
 #include <cassert>
@@ -84,12 +85,12 @@ private:
         const int conservative_estimate = (int)ceil(1.1 * n + 10);
         capacity = 128 * ((conservative_estimate + 127) / 128);
 
-        CUDA_Check(cudaMalloc(&devptr, sizeof(T) * capacity));
+        devptr = (T*) DeviceMemoryPool::get().allocate(sizeof(T) * capacity);
 
         if (copy && dold != nullptr)
             if (oldsize > 0) CUDA_Check(cudaMemcpyAsync(devptr, dold, sizeof(T) * oldsize, cudaMemcpyDeviceToDevice, stream));
 
-        CUDA_Check(cudaFree(dold));
+        DeviceMemoryPool::get().deallocate(dold);
 
         debug4("Allocating DeviceBuffer<%s> from %d x %d  to %d x %d",
                 typeid(T).name(),
@@ -133,7 +134,7 @@ public:
     {
         if (devptr != nullptr)
         {
-            CUDA_Check(cudaFree(devptr));
+            DeviceMemoryPool::get().deallocate(devptr);
             debug4("Destroying DeviceBuffer<%s>", typeid(T).name());
         }
     }
@@ -401,7 +402,7 @@ private:
         capacity = 128 * ((conservative_estimate + 127) / 128);
 
         CUDA_Check(cudaHostAlloc(&hostptr, sizeof(T) * capacity, 0));
-        CUDA_Check(cudaMalloc(&devptr, sizeof(T) * capacity));
+        devptr = (T*) DeviceMemoryPool::get().allocate(sizeof(T) * capacity);
 
         if (copy && hold != nullptr && oldsize > 0)
         {
@@ -411,7 +412,7 @@ private:
         }
 
         CUDA_Check(cudaFreeHost(hold));
-        CUDA_Check(cudaFree(dold));
+        DeviceMemoryPool::get().deallocate(dold);
 
         debug4("Allocating PinnedBuffer<%s> from %d x %d  to %d x %d",
                 typeid(T).name(),
@@ -463,7 +464,7 @@ public:
         if (devptr != nullptr)
         {
             CUDA_Check(cudaFreeHost(hostptr));
-            CUDA_Check(cudaFree(devptr));
+            DeviceMemoryPool::get().deallocate(devptr);
             debug4("Destroying PinnedBuffer<%s>", typeid(T).name());
         }
     }
@@ -2,19 +2,102 @@
 
 #include "domain.h"
 
-DomainInfo createDomainInfo(MPI_Comm cartComm, float3 globalSize)
+#include <algorithm>
+
+static void getCartInfo(MPI_Comm cartComm, int3& nranks3D, int3& rank3D)
 {
-    DomainInfo domain;
     int ranks[3], periods[3], coords[3];
 
     MPI_Check(MPI_Cart_get(cartComm, 3, ranks, periods, coords));
 
-    int3 nranks3D = {ranks[0], ranks[1], ranks[2]};
-    int3 rank3D = {coords[0], coords[1], coords[2]};
+    nranks3D = {ranks[0], ranks[1], ranks[2]};
+    rank3D   = {coords[0], coords[1], coords[2]};
+}
+
+DomainInfo createDomainInfo(MPI_Comm cartComm, float3 globalSize)
+{
+    DomainInfo domain;
+    int3 nranks3D, rank3D;
+
+    getCartInfo(cartComm, nranks3D, rank3D);
 
     domain.globalSize = globalSize;
     domain.localSize = domain.globalSize / make_float3(nranks3D);
     domain.globalStart = domain.localSize * make_float3(rank3D);
 
+    domain.lowerNeighbourSize = domain.localSize;
+    domain.upperNeighbourSize = domain.localSize;
+
+    return domain;
+}
+
+static void checkPlanes(const std::vector<float>& planes, int nranks, float size, char axis)
+{
+    if ((int) planes.size() != nranks + 1)
+        die("Domain split along %c has %d planes, expected %d", axis, (int) planes.size(), nranks + 1);
+
+    if (planes.front() != 0.0f || planes.back() != size)
+        die("Domain split along %c must span [0, %g], got [%g, %g]", axis, size, planes.front(), planes.back());
+
+    for (int i = 0; i < nranks; ++i)
+        if (planes[i+1] <= planes[i])
+            die("Domain split along %c is not strictly increasing at plane %d", axis, i);
+}
+
+// sizes of the subdomain with cartesian coordinate id and of its periodic neighbours
+static void getSizes1D(const std::vector<float>& planes, int id, float& lower, float& mine, float& upper)
+{
+    const int n = planes.size() - 1;
+    auto size = [&planes, n] (int i) {
+        i = (i + n) % n;
+        return planes[i+1] - planes[i];
+    };
+
+    lower = size(id-1);
+    mine  = size(id);
+    upper = size(id+1);
+}
+
+DomainInfo createDomainInfo(MPI_Comm cartComm, float3 globalSize, const DomainSplit& split)
+{
+    if (split.empty())
+        return createDomainInfo(cartComm, globalSize);
+
+    DomainInfo domain;
+    int3 nranks3D, rank3D;
+
+    getCartInfo(cartComm, nranks3D, rank3D);
+
+    checkPlanes(split.x, nranks3D.x, globalSize.x, 'x');
+    checkPlanes(split.y, nranks3D.y, globalSize.y, 'y');
+    checkPlanes(split.z, nranks3D.z, globalSize.z, 'z');
+
+    domain.globalSize  = globalSize;
+    domain.globalStart = {split.x[rank3D.x], split.y[rank3D.y], split.z[rank3D.z]};
+
+    getSizes1D(split.x, rank3D.x, domain.lowerNeighbourSize.x, domain.localSize.x, domain.upperNeighbourSize.x);
+    getSizes1D(split.y, rank3D.y, domain.lowerNeighbourSize.y, domain.localSize.y, domain.upperNeighbourSize.y);
+    getSizes1D(split.z, rank3D.z, domain.lowerNeighbourSize.z, domain.localSize.z, domain.upperNeighbourSize.z);
+
     return domain;
 }
+
+bool DomainSplit::empty() const
+{
+    return x.empty() || y.empty() || z.empty();
+}
+
+static int findSlab(const std::vector<float>& planes, float r)
+{
+    const int n = planes.size() - 1;
+    if (r < planes.front() || r >= planes.back())
+        return n;
+
+    auto it = std::upper_bound(planes.begin(), planes.end(), r);
+    return std::distance(planes.begin(), it) - 1;
+}
+
+int3 DomainSplit::getRank3D(float3 r) const
+{
+    return {findSlab(x, r.x), findSlab(y, r.y), findSlab(z, r.z)};
+}
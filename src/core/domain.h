@@ -5,11 +5,20 @@
 
 #include <mpi.h>
 #include <cuda_runtime.h>
+#include <vector>
 #include <vector_types.h>
 
+inline __HD__ float _neighbourShift1D(int dir, float size, float lowerSize, float upperSize)
+{
+    if (dir > 0) return  0.5f * (size + upperSize);
+    if (dir < 0) return -0.5f * (size + lowerSize);
+    return 0.0f;
+}
+
 struct DomainInfo
 {
     float3 globalSize, globalStart, localSize;
+    float3 lowerNeighbourSize, upperNeighbourSize; ///< sizes of the adjacent subdomains along each axis
 
     inline __HD__ float3 local2global(float3 x) const
     {
@@ -26,7 +35,37 @@ struct DomainInfo
         return (globalStart.x <= xg.x) && (xg.x < (globalStart.x + localSize.x))
             && (globalStart.y <= xg.y) && (xg.y < (globalStart.y + localSize.y))
             && (globalStart.z <= xg.z) && (xg.z < (globalStart.z + localSize.z));
-    }    
+    }
+
+    /**
+     * Distance between the center of this subdomain and the center of
+     * the neighbouring one in direction \p dir (components are -1, 0 or 1).
+     * Local coordinates have to be shifted by minus this value when
+     * moving to the neighbour. Equals localSize * dir for uniform splits
+     */
+    inline __HD__ float3 neighbourShift(int3 dir) const
+    {
+        return { _neighbourShift1D(dir.x, localSize.x, lowerNeighbourSize.x, upperNeighbourSize.x),
+                 _neighbourShift1D(dir.y, localSize.y, lowerNeighbourSize.y, upperNeighbourSize.y),
+                 _neighbourShift1D(dir.z, localSize.z, lowerNeighbourSize.z, upperNeighbourSize.z) };
+    }
+};
+
+/**
+ * Positions of the planes separating the subdomains along each axis.
+ * Along an axis with n ranks there are n+1 planes, the first one is at 0
+ * and the last one is at the global domain size.
+ * Empty split means uniform decomposition.
+ */
+struct DomainSplit
+{
+    std::vector<float> x, y, z;
+
+    bool empty() const;
+
+    /// @return cartesian coordinates of the rank owning global position \p r; number of ranks along the axis if outside of the domain
+    int3 getRank3D(float3 r) const;
 };
 
 DomainInfo createDomainInfo(MPI_Comm cartComm, float3 globalSize);
+DomainInfo createDomainInfo(MPI_Comm cartComm, float3 globalSize, const DomainSplit& split);
@@ -1,5 +1,6 @@
 #include <fstream>
 #include <random>
+#include <vector>
 
 #include <core/pvs/membrane_vector.h>
 #include <core/pvs/particle_vector.h>
@@ -28,7 +29,8 @@ MembraneIC::~MembraneIC() = default;
  * shifted to the COM and rotated according to Q.
  *
  * The RBCs with COM outside of an MPI process's domain will be discarded on
- * that process.
+ * that process. A warning is issued if some RBCs are not created on any of
+ * the processes, i.e. their COM lies outside of the global domain.
  *
  * Set unique id to all the particles and also write unique cell ids into
  * 'ids' per-object channel
@@ -41,38 +43,52 @@ void MembraneIC::exec(const MPI_Comm& comm, ParticleVector* pv, cudaStream_t str
     if (ov == nullptr)
         die("RBCs can only be generated out of rbc object vectors");
 
+    // Objects owned by this process
+    std::vector<int> localObjs;
+
+    for (int objId = 0; objId < com_q.size(); objId++)
+    {
+        auto& entry = com_q[objId];
+        float3 com = {entry[0], entry[1], entry[2]};
+
+        if (domain.inSubDomain(com))
+            localObjs.push_back(objId);
+    }
+
     // Local number of objects
-    int nObjs=0;
+    int nObjs = localObjs.size();
+    const int nvertices = ov->mesh->getNvertices();
 
-    for (auto& entry : com_q)
+    // all the objects are allocated at once
+    ov->local()->resize(nObjs * nvertices, stream);
+
+    for (int obj = 0; obj < nObjs; obj++)
     {
+        auto& entry = com_q[localObjs[obj]];
         float3 com = {entry[0], entry[1], entry[2]};
         float4 q   = {entry[3], entry[4], entry[5], entry[6]};
 
         q = normalize(q);
+        com = domain.global2local(com);
 
-        if (domain.globalStart.x <= com.x && com.x < domain.globalStart.x + domain.localSize.x &&
-            domain.globalStart.y <= com.y && com.y < domain.globalStart.y + domain.localSize.y &&
-            domain.globalStart.z <= com.z && com.z < domain.globalStart.z + domain.localSize.z)
+        for (int i=0; i<nvertices; i++)
         {
-            com = domain.global2local(com);
-            int oldSize = ov->local()->size();
-            ov->local()->resize(oldSize + ov->mesh->getNvertices(), stream);
-
-            for (int i=0; i<ov->mesh->getNvertices(); i++)
-            {
-                float3 r = rotate(f4tof3( ov->mesh->vertexCoordinates[i] * globalScale ), q) + com;
-                Particle p;
-                p.r = r;
-                p.u = make_float3(0);
-
-                ov->local()->coosvels[oldSize + i] = p;
-            }
+            float3 r = rotate(f4tof3( ov->mesh->vertexCoordinates[i] * globalScale ), q) + com;
+            Particle p;
+            p.r = r;
+            p.u = make_float3(0);
 
-            nObjs++;
+            ov->local()->coosvels[obj * nvertices + i] = p;
         }
     }
 
+    int nTotal = 0;
+    MPI_Check( MPI_Allreduce(&nObjs, &nTotal, 1, MPI_INT, MPI_SUM, comm) );
+
+    if (nTotal != com_q.size())
+        warn("Only %d out of %d '%s' membranes were created, the others have their COM outside of the domain",
+             nTotal, (int) com_q.size(), ov->name.c_str());
+
     // Set ids
     // Need to do that, as not all the objects in com_q may be valid
     int totalCount=0; // TODO: int64!
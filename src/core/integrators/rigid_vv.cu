@@ -60,7 +60,7 @@ void IntegratorVVRigid::stage2(ParticleVector *pv, cudaStream_t stream)
 
     SAFE_KERNEL_LAUNCH(
             RigidIntegrationKernels::collectRigidForces,
-            getNblocks(2*ovView.size, 128), 128, 0, stream,
+            ovView.nObjects, 128, 0, stream,
             ovView );
 
     SAFE_KERNEL_LAUNCH(
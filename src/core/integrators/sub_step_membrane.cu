@@ -1,18 +1,43 @@
 #include "sub_step_membrane.h"
 
-#include "forcing_terms/none.h"
-#include "vv.h"
-
 #include <core/interactions/membrane.h>
 #include <core/logger.h>
 #include <core/pvs/particle_vector.h>
+#include <core/pvs/views/pv.h>
 #include <core/utils/common.h>
+#include <core/utils/cuda_common.h>
 #include <core/utils/kernel_launch.h>
 
+namespace SubStepMembraneKernels
+{
+/**
+ * Velocity-Verlet step from the old particles, same as IntegratorVV without forcing term.
+ * If \p slowForces is not null, the forces are then set back to them for the next sub step.
+ */
+__global__ void integrate(PVviewWithOldParticles view, const float4 *slowForces, const float dt)
+{
+    const int pid = blockIdx.x * blockDim.x + threadIdx.x;
+    if (pid >= view.size) return;
+
+    Particle p(readNoCache(view.old_particles + 2*pid),
+               readNoCache(view.old_particles + 2*pid + 1));
+
+    const float3 f = Float3_int(view.forces[pid]).v;
+
+    p.u += f*view.invMass*dt;
+    p.r += p.u*dt;
+
+    writeNoCache(view.particles + 2*pid,     p.r2Float4());
+    writeNoCache(view.particles + 2*pid + 1, p.u2Float4());
+
+    if (slowForces != nullptr)
+        view.forces[pid] = slowForces[pid];
+}
+} // namespace SubStepMembraneKernels
+
 IntegratorSubStepMembrane::IntegratorSubStepMembrane(const YmrState *state, std::string name, int substeps, Interaction *fastForces) :
     Integrator(state, name),
     substeps(substeps),
-    subIntegrator(new IntegratorVV<Forcing_None>(state, name + "_sub", Forcing_None())),
     fastForces(fastForces),
     subState(*state)
 {    
@@ -20,12 +45,10 @@ IntegratorSubStepMembrane::IntegratorSubStepMembrane(const YmrState *state, std:
         die("IntegratorSubStepMembrane '%s': expects an interaction of type <InteractionMembrane>.",
             name.c_str());
 
-    debug("setup substep integrator '%s' for %d substeps with sub integrator '%s' and fast forces '%s'",
-          name.c_str(), substeps, subIntegrator->name.c_str(), fastForces->name.c_str());
+    debug("setup substep integrator '%s' for %d substeps with fast forces '%s'",
+          name.c_str(), substeps, fastForces->name.c_str());
 
     updateSubState();
-    
-    subIntegrator->state = &subState;
 }
 
 IntegratorSubStepMembrane::~IntegratorSubStepMembrane() = default;
@@ -49,14 +72,27 @@ void IntegratorSubStepMembrane::stage2(ParticleVector *pv, cudaStream_t stream)
     auto *savedStatePtr = fastForces->state;
     fastForces->state = &subState;
     
-    for (int substep = 0; substep < substeps; ++ substep) {
+    const int nthreads = 128;
 
-        if (substep != 0)
-            pv->local()->forces.copy(slowForces, stream);        
+    for (int substep = 0; substep < substeps; ++ substep) {
 
         fastForces->local(pv, pv, nullptr, nullptr, stream);
-        
-        subIntegrator->stage2(pv, stream);
+
+        // New particles now become old
+        std::swap(pv->local()->coosvels, *pv->local()->extraPerParticle.getData<Particle>(ChannelNames::oldParts));
+        PVviewWithOldParticles view(pv, pv->local());
+
+        // the forces are reset to the slow ones in the same pass, except after the last sub step
+        const bool last = (substep == substeps - 1);
+        const float4 *nextForces = last ? nullptr : reinterpret_cast<const float4*>(slowForces.devPtr());
+
+        debug2("Integrating (sub step %d) %d %s particles, timestep is %f",
+               substep, view.size, pv->name.c_str(), subState.dt);
+
+        SAFE_KERNEL_LAUNCH(
+                SubStepMembraneKernels::integrate,
+                getNblocks(view.size, nthreads), nthreads, 0, stream,
+                view, nextForces, subState.dt );
 
         subState.currentTime += subState.dt;
     }
@@ -21,7 +21,6 @@ public:
 private:
 
     Interaction *fastForces; /* interactions (self) called `substeps` times per time step */
-    std::unique_ptr<Integrator> subIntegrator;
     YmrState subState;
     
     int substeps; /* number of substeps */
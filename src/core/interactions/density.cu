@@ -47,6 +47,12 @@ void BasicInteractionDensity::halo (ParticleVector *pv1, ParticleVector *pv2, Ce
     impl->halo(pv1, pv2, cl1, cl2, stream);
 }
 
+void BasicInteractionDensity::localFused(ParticleVector *pv1, const std::vector<ParticleVector*>& pv2s,
+                                         CellList *cl1, const std::vector<CellList*>& cl2s, cudaStream_t stream)
+{
+    impl->localFused(pv1, pv2s, cl1, cl2s, stream);
+}
+
 
 template <class DensityKernel>
 InteractionDensity<DensityKernel>::InteractionDensity(const YmrState *state, std::string name, float rc,
@@ -3,6 +3,7 @@
 #include "pairwise_interactions/dpd.h"
 
 #include <core/celllist.h>
+#include <core/utils/common.h>
 #include <core/utils/make_unique.h>
 #include <core/pvs/particle_vector.h>
 
@@ -27,6 +28,13 @@ InteractionDPD::~InteractionDPD() = default;
 void InteractionDPD::setPrerequisites(ParticleVector *pv1, ParticleVector *pv2, CellList *cl1, CellList *cl2)
 {
     impl->setPrerequisites(pv1, pv2, cl1, cl2);
+
+    pv1->requireDataPerParticle<ushort4>(ChannelNames::compactPositions, ExtraDataManager::PersistenceMode::None);
+    pv2->requireDataPerParticle<ushort4>(ChannelNames::compactPositions, ExtraDataManager::PersistenceMode::None);
+
+    // filled by the cell-lists at every build, see CellList::_computeCompactPositions()
+    cl1->requireExtraDataPerParticle<ushort4>(ChannelNames::compactPositions);
+    cl2->requireExtraDataPerParticle<ushort4>(ChannelNames::compactPositions);
 }
 
 std::vector<Interaction::InteractionChannel> InteractionDPD::getFinalOutputChannels() const
@@ -48,6 +56,12 @@ void InteractionDPD::halo(ParticleVector *pv1, ParticleVector *pv2,
     impl->halo(pv1, pv2, cl1, cl2, stream);
 }
 
+void InteractionDPD::localFused(ParticleVector *pv1, const std::vector<ParticleVector*>& pv2s,
+                                CellList *cl1, const std::vector<CellList*>& cl2s, cudaStream_t stream)
+{
+    impl->localFused(pv1, pv2s, cl1, cl2s, stream);
+}
+
 void InteractionDPD::setSpecificPair(ParticleVector *pv1, ParticleVector *pv2, 
                                      float a, float gamma, float kbt, float power)
 {
@@ -12,6 +12,13 @@ Interaction::~Interaction() = default;
 void Interaction::setPrerequisites(ParticleVector *pv1, ParticleVector *pv2, CellList *cl1, CellList *cl2)
 {}
 
+void Interaction::localFused(ParticleVector *pv1, const std::vector<ParticleVector*>& pv2s,
+                             CellList *cl1, const std::vector<CellList*>& cl2s, cudaStream_t stream)
+{
+    for (size_t i = 0; i < pv2s.size(); ++i)
+        local(pv1, pv2s[i], cl1, cl2s[i], stream);
+}
+
 std::vector<Interaction::InteractionChannel> Interaction::getIntermediateOutputChannels() const
 {
     return {};
@@ -59,6 +59,19 @@ public:
     virtual void halo(ParticleVector *pv1, ParticleVector *pv2, CellList *cl1,
                       CellList *cl2, cudaStream_t stream) = 0;
 
+    /**
+     * Compute local interactions of \p pv1 with all the ParticleVectors of \p pv2s.
+     * Implementations may fuse several pairs into one kernel.
+     * Default: call local() for every pair
+     *
+     * @param pv1 first interacting ParticleVector
+     * @param pv2s second interacting ParticleVectors, may contain \p pv1
+     * @param cl1 cell-list built for the appropriate cut-off raduis #rc for \p pv1
+     * @param cl2s cell-lists built for the appropriate cut-off raduis #rc for each of \p pv2s
+     */
+    virtual void localFused(ParticleVector *pv1, const std::vector<ParticleVector*>& pv2s,
+                            CellList *cl1, const std::vector<CellList*>& cl2s, cudaStream_t stream);
+
 
     /// monitor activity of a channel
     using ActivePredicate = std::function<bool()>;
@@ -16,6 +16,9 @@ struct InteractionLJ : public Interaction
     void local (ParticleVector *pv1, ParticleVector *pv2, CellList *cl1, CellList *cl2, cudaStream_t stream) override;
     void halo  (ParticleVector *pv1, ParticleVector *pv2, CellList *cl1, CellList *cl2, cudaStream_t stream) override;
 
+    void localFused(ParticleVector *pv1, const std::vector<ParticleVector*>& pv2s,
+                    CellList *cl1, const std::vector<CellList*>& cl2s, cudaStream_t stream) override;
+
     virtual void setSpecificPair(ParticleVector* pv1, ParticleVector* pv2, 
                                  float epsilon, float sigma, float maxForce);
 
@@ -62,6 +62,12 @@ void InteractionMDPD::halo(ParticleVector *pv1, ParticleVector *pv2,
     impl->halo(pv1, pv2, cl1, cl2, stream);
 }
 
+void InteractionMDPD::localFused(ParticleVector *pv1, const std::vector<ParticleVector*>& pv2s,
+                                 CellList *cl1, const std::vector<CellList*>& cl2s, cudaStream_t stream)
+{
+    impl->localFused(pv1, pv2s, cl1, cl2s, stream);
+}
+
 void InteractionMDPD::setSpecificPair(ParticleVector* pv1, ParticleVector* pv2, 
                                       float a, float b, float gamma, float kbt, float power)
 {
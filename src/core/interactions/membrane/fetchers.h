@@ -12,7 +12,13 @@ public:
     __D__ inline VertexType fetchVertex(const ViewType& view, int i) const
     {
         // 2 because of float4
-        return make_real3(Float3_int(view.particles[2 * i]).v);
+        return makeVertex(view, make_real3(Float3_int(view.particles[2 * i]).v), i);
+    }
+
+    /// build the vertex from an already loaded position
+    __D__ inline VertexType makeVertex(const ViewType& view, real3 r, int i) const
+    {
+        return r;
     }
 };
 
@@ -31,7 +37,11 @@ public:
 
     __D__ inline VertexType fetchVertex(const ViewType& view, int i) const
     {
-        return {make_real3(Float3_int(view.particles[2 * i]).v),
-                real(view.vertexMeanCurvatures[i])};
+        return makeVertex(view, make_real3(Float3_int(view.particles[2 * i]).v), i);
+    }
+
+    __D__ inline VertexType makeVertex(const ViewType& view, real3 r, int i) const
+    {
+        return {r, real(view.vertexMeanCurvatures[i])};
     }
 };
@@ -64,95 +64,83 @@ __device__ inline real3 _ffluct(real3 v1, real3 v2, int i1, int i2,
     return (mean0var1 * parameters.sigma_rnd / length(x21)) * x21;
 }
 
-template <class TriangleInteraction>
-__device__ inline real3 bondTriangleForce(
+/**
+ * Bond, triangle and dihedral forces acting on one vertex.
+ *
+ * Both interactions go around the same ring of neighbours, so they share
+ * a single loop: every neighbour is loaded only once and kept in registers
+ * while it is part of the sliding window (v1, v2, v3) of the current step.
+ *
+ *       v3
+ *     /   \
+ *   v2 --> v0
+ *     \   /
+ *       V
+ *       v1
+ */
+template <class TriangleInteraction, class DihedralInteraction>
+__device__ inline real3 vertexForce(
         const TriangleInteraction& triangleInteraction,
+        DihedralInteraction& dihedralInteraction,
         ParticleReal p, int locId, int rbcId,
         const OVviewWithAreaVolume& view,
+        const typename DihedralInteraction::ViewType& dihedralView,
         const MembraneMeshView& mesh,
         const GPU_CommonMembraneParameters& parameters)
 {
-    real3 f0 = make_real3(0.0_r);
+    const int offset = rbcId * mesh.nvertices;
+
     const int startId = mesh.maxDegree * locId;
     const int degree = mesh.degrees[locId];
+    const int * __restrict__ adjacent = mesh.adjacent + startId;
+
+    int idv0 = offset + locId;
+    int idv1 = offset + adjacent[0];
+    int idv2 = offset + adjacent[1];
 
-    int idv0 = rbcId * mesh.nvertices + locId;
-    int idv1 = rbcId * mesh.nvertices + mesh.adjacent[startId];
     auto p1 = fetchParticle(view, idv1);
+    auto p2 = fetchParticle(view, idv2);
+
+    auto v0 = dihedralInteraction.makeVertex(dihedralView, p.r,  idv0);
+    auto v1 = dihedralInteraction.makeVertex(dihedralView, p1.r, idv1);
+    auto v2 = dihedralInteraction.makeVertex(dihedralView, p2.r, idv2);
 
     real totArea   = view.area_volumes[rbcId].x;
     real totVolume = view.area_volumes[rbcId].y;
 
+    dihedralInteraction.computeCommon(dihedralView, rbcId);
+
+    real3 f0 = make_real3(0.0_r);
+
 #pragma unroll 2
     for (int i = 0; i < degree; i++)
     {
         int i1 = startId + i;
         int i2 = startId + ((i+1) % degree);
-        
-        int idv2 = rbcId * mesh.nvertices + mesh.adjacent[i2];
 
-        auto p2 = fetchParticle(view, idv2);
+        int idv3 = offset + adjacent[(i+2) % degree];
+
+        auto p3 = fetchParticle(view, idv3);
+        auto v3 = dihedralInteraction.makeVertex(dihedralView, p3.r, idv3);
 
         auto eq = triangleInteraction.getEquilibriumDesc(mesh, i1, i2);
-        
+
         f0 += triangleInteraction (p.r, p1.r, p2.r, eq)
             + _fconstrainArea     (p.r, p1.r, p2.r, totArea,   parameters)
             + _fconstrainVolume   (p.r, p1.r, p2.r, totVolume, parameters)
             + _fvisc              (p,   p1,                    parameters)
             + _ffluct             (p.r, p1.r, idv0, idv1,      parameters);
 
-        idv1 = idv2;
-        p1   = p2;
-    }
-
-    return f0;
-}
-
-template <class DihedralInteraction>
-__device__ inline real3 dihedralForce(int locId, int rbcId,
-                                       const typename DihedralInteraction::ViewType& view,
-                                       DihedralInteraction& dihedralInteraction,
-                                       const MembraneMeshView& mesh)
-{
-    const int offset = rbcId * mesh.nvertices;
-
-    const int startId = mesh.maxDegree * locId;
-    const int degree = mesh.degrees[locId];
-
-    int idv0 = offset + locId;
-    int idv1 = offset + mesh.adjacent[startId];
-    int idv2 = offset + mesh.adjacent[startId+1];
-
-    auto v0 = dihedralInteraction.fetchVertex(view, idv0);
-    auto v1 = dihedralInteraction.fetchVertex(view, idv1);
-    auto v2 = dihedralInteraction.fetchVertex(view, idv2);
-
-    //       v3
-    //     /   \
-    //   v2 --> v0
-    //     \   /
-    //       V
-    //       v1
-
-    real3 f0 = make_real3(0.0_r);
-
-    dihedralInteraction.computeCommon(view, rbcId);
-
-#pragma unroll 2
-    for (int i = 0; i < degree; i++)
-    {
         real3 f1 = make_real3(0.0_r);
-        int idv3 = offset + mesh.adjacent[startId + (i+2) % degree];
-
-        auto v3 = dihedralInteraction.fetchVertex(view, idv3);
-
         f0 += dihedralInteraction(v0, v1, v2, v3, f1);
 
         atomicAdd(view.forces + idv1, make_float3(f1));
-            
+
+        p1   = p2  ; p2   = p3  ;
         v1   = v2  ; v2   = v3  ;
         idv1 = idv2; idv2 = idv3;
     }
+
     return f0;
 }
 
@@ -175,9 +163,8 @@ __global__ void computeMembraneForces(TriangleInteraction triangleInteraction,
 
     auto p = fetchParticle(view, pid);
 
-    real3 f;
-    f  = bondTriangleForce(triangleInteraction, p, locId, rbcId, view, mesh, parameters);
-    f += dihedralForce(locId, rbcId, dihedralView, dihedralInteraction, mesh);
+    real3 f = vertexForce(triangleInteraction, dihedralInteraction, p, locId, rbcId,
+                          view, dihedralView, mesh, parameters);
 
     atomicAdd(view.forces + pid, make_float3(f));
 }
@@ -39,6 +39,54 @@ public:
         //    computeLocal(pv2, pv1, cl2, cl1, state->currentTime, stream);
     }
 
+    /**
+     * Interface to computeLocalFused().
+     *
+     * Self interaction is computed separately, external interactions with
+     * the other ParticleVector are fused in groups of up to #MaxFusedSources.
+     * Small destination ParticleVector are not worth fusing: they need
+     * many threads per particle to expose enough parallelism.
+     */
+    void localFused(ParticleVector *pv1, const std::vector<ParticleVector*>& pv2s,
+                    CellList *cl1, const std::vector<CellList*>& cl2s, cudaStream_t stream) override
+    {
+        std::vector<ParticleVector*> srcPVs;
+        std::vector<CellList*> srcCLs;
+
+        for (size_t i = 0; i < pv2s.size(); ++i)
+        {
+            if (pv2s[i] == pv1 || pv1->local()->size() < minFusedSize || pv2s[i]->local()->size() == 0)
+            {
+                computeLocal(pv1, pv2s[i], cl1, cl2s[i], stream);
+            }
+            else
+            {
+                srcPVs.push_back(pv2s[i]);
+                srcCLs.push_back(cl2s[i]);
+            }
+        }
+
+        auto source = [&] (size_t i) {
+            return prepareFusedSource(pv1, srcPVs[i], cl1, srcCLs[i]);
+        };
+
+        for (size_t b = 0; b < srcPVs.size(); b += MaxFusedSources)
+        {
+            switch (std::min(srcPVs.size() - b, (size_t) MaxFusedSources))
+            {
+            case 3:
+                computeLocalFused<3>(cl1, {{ source(b), source(b+1), source(b+2) }}, stream);
+                break;
+            case 2:
+                computeLocalFused<2>(cl1, {{ source(b), source(b+1) }}, stream);
+                break;
+            default:
+                computeLocal(pv1, srcPVs[b], cl1, srcCLs[b], stream);
+                break;
+            }
+        }
+    }
+
     /**
      * Interface to computeHalo().
      *
@@ -90,6 +138,9 @@ public:
 
 private:
 
+    static constexpr int MaxFusedSources = 3;
+    static constexpr int minFusedSize = 10000;
+
     PairwiseInteraction defaultPair;
     std::map< std::pair<std::string, std::string>, PairwiseInteraction > intMap;
 
@@ -174,6 +225,51 @@ private:
         }
     }
 
+    using HandlerType = typename PairwiseInteraction::HandlerType;
+
+    /**
+     * Setup the interaction between local particles of \p pv1 and \p pv2
+     * and collect what the fused kernel needs to compute it
+     */
+    FusedSource<HandlerType> prepareFusedSource(ParticleVector *pv1, ParticleVector *pv2, CellList *cl1, CellList *cl2)
+    {
+        using ViewType = typename PairwiseInteraction::ViewType;
+
+        auto& pair = getPairwiseInteraction(pv1->name, pv2->name);
+        pair.setup(pv1->local(), pv2->local(), cl1, cl2, state);
+
+        debug("Computing fused external forces for %s - %s (%d - %d particles)",
+              pv1->name.c_str(), pv2->name.c_str(), pv1->local()->size(), pv2->local()->size());
+
+        return { cl2->getView<ViewType>(), cl2->cellInfo(), pair.handler() };
+    }
+
+    /**
+     * Compute external forces between local particles of the ParticleVector
+     * of \p cl1 and of \p NSources other ParticleVector within one kernel.
+     *
+     * Equivalent to calling computeLocal() for each of the pairs.
+     */
+    template<int NSources>
+    void computeLocalFused(CellList *cl1, const FusedSources<HandlerType, NSources>& sources, cudaStream_t stream)
+    {
+        using ViewType = typename PairwiseInteraction::ViewType;
+
+        auto dstView = cl1->getView<ViewType>();
+
+        const int nth = 128;
+        if (dstView.size < 400000)
+            SAFE_KERNEL_LAUNCH(
+                    computeExternalInteractionsFused<3 COMMA NSources>,
+                    getNblocks(3*dstView.size, nth), nth, 0, stream,
+                    dstView, sources, rc*rc );
+        else
+            SAFE_KERNEL_LAUNCH(
+                    computeExternalInteractionsFused<1 COMMA NSources>,
+                    getNblocks(dstView.size, nth), nth, 0, stream,
+                    dstView, sources, rc*rc );
+    }
+
     /**
      * Compute halo forces
      */
@@ -6,48 +6,52 @@
 #include <core/interactions/utils/step_random_gen.h>
 #include <core/ymero_state.h>
 
+#include <cmath>
 #include <random>
 
 class CellList;
 class LocalParticleVector;
 
-#ifndef __NVCC__
-static float fastPower(float x, float a)
-{
-    return pow(x, a);
-}
-#else
+#ifdef __NVCC__
 #include <core/utils/cuda_common.h>
 #endif
 
 
-class PairwiseDPDHandler : public ParticleFetcherWithVelocity
+class PairwiseDPDHandler : public ParticleFetcherWithVelocityAndCompactPositions
 {
 public:
 
-    using ViewType     = PVview;
+    using ViewType     = PVviewWithCompactPositions;
     using ParticleType = Particle;
     
     PairwiseDPDHandler(float rc, float a, float gamma, float kbT, float dt, float power) :
-        ParticleFetcherWithVelocity(rc),
+        ParticleFetcherWithVelocityAndCompactPositions(rc),
         a(a),
         gamma(gamma),
         power(power)
     {
         sigma = sqrt(2 * gamma * kbT / dt);
         invrc = 1.0 / rc;
+
+        // same tolerance as in fastPower()
+        auto close = [power] (float k) { return fabsf(power - k) < 1e-6f; };
+
+        if      (close(1.0f))  powerMode = PowerMode::One;
+        else if (close(0.5f))  powerMode = PowerMode::Half;
+        else if (close(0.25f)) powerMode = PowerMode::Quarter;
+        else                   powerMode = PowerMode::Generic;
     }
     
     __D__ inline float3 operator()(const ParticleType dst, int dstId, const ParticleType src, int srcId) const
     {
         const float3 dr = dst.r - src.r;
         const float rij2 = dot(dr, dr);
-        if (rij2 > rc2) return make_float3(0.0f);
+        if (rij2 >= rc2) return make_float3(0.0f);
 
         const float invrij = rsqrtf(rij2);
         const float rij = rij2 * invrij;
         const float argwr = 1.0f - rij * invrc;
-        const float wr = fastPower(argwr, power);
+        const float wr = weight(argwr);
 
         const float3 dr_r = dr * invrij;
         const float3 du = dst.u - src.u;
@@ -64,6 +68,21 @@ public:
 
 protected:
 
+    /// Common exponents of the dissipative kernel, detected once instead of for every pair
+    enum class PowerMode { One, Half, Quarter, Generic };
+
+    __D__ inline float weight(float argwr) const
+    {
+        switch (powerMode)
+        {
+        case PowerMode::One:     return argwr;
+        case PowerMode::Half:    return sqrtf(fabsf(argwr));
+        case PowerMode::Quarter: return sqrtf(sqrtf(fabsf(argwr)));
+        default:                 return powf(fabsf(argwr), power);
+        }
+    }
+
+    PowerMode powerMode;
     float a, gamma, sigma, power;
     float invrc;
     float seed;
@@ -88,6 +107,7 @@ public:
     void setup(LocalParticleVector* lpv1, LocalParticleVector* lpv2, CellList* cl1, CellList* cl2, const YmrState *state)
     {
         seed = stepGen.generate(state);
+        setCompactStep(PVviewWithCompactPositions::getCompactStep(state->domain.localSize));
     }
 
 protected:
@@ -6,6 +6,9 @@
 #include <core/utils/cuda_rng.h>
 #include <core/utils/helper_math.h>
 
+#include <algorithm>
+#include <limits>
+
 #ifndef __NVCC__
 static float4 readNoCache(const float4* addr)
 {
@@ -171,3 +174,58 @@ public:
 
     __D__ inline float3 getPosition(const ParticleType& p) const {return p.p.r;}
 };
+
+/**
+ * fetcher that reads positions and velocities,
+ * the cut-off check of the source particles uses the compact positions
+ * (see PVviewWithCompactPositions): only 8 bytes are loaded for
+ * the source particles which are not interacting.
+ *
+ * The check is conservative: the cut-off is extended by the quantization error,
+ * so the handler must check the exact distance again.
+ * It only holds as long as the compact positions match the positions,
+ * i.e. they must be encoded by the cell-list build of the source particles.
+ * Source particles are fully read in readExtraData().
+ */
+class ParticleFetcherWithVelocityAndCompactPositions : public ParticleFetcherWithVelocity
+{
+public:
+
+    using ViewType     = PVviewWithCompactPositions;
+    using ParticleType = Particle;
+
+    ParticleFetcherWithVelocityAndCompactPositions(float rc) :
+        ParticleFetcherWithVelocity(rc),
+        screenRc2(std::numeric_limits<float>::max())
+    {}
+
+    /// set the quantization step of the compact positions; until then all the pairs pass the cut-off check
+    void setCompactStep(float3 step)
+    {
+        const float maxStep = std::max(step.x, std::max(step.y, step.z));
+        const float screenRc = rc + sqrtf(3.0f) * maxStep;
+        screenRc2 = screenRc * screenRc;
+    }
+
+    __D__ inline void readCoordinates(ParticleType& p, const ViewType& view, int id) const
+    {
+        const ushort4 c = view.compactPositions[id];
+        p.r  = view.compactOrigin + view.compactStep * make_float3(c.x, c.y, c.z);
+        p.i1 = c.w;
+    }
+
+    __D__ inline void readExtraData(ParticleType& p, const ViewType& view, int id) const
+    {
+        p = Particle(view.particles, id);
+    }
+
+    /// \p src must come from readCoordinates(), \p dst must be fully read
+    __D__ inline bool withinCutoff(const ParticleType& src, const ParticleType& dst) const
+    {
+        return src.i1 != 0 || distance2(src.r, dst.r) < screenRc2;
+    }
+
+protected:
+
+    float screenRc2;
+};
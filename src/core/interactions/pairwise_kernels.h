@@ -418,3 +418,82 @@ __global__ void computeExternalInteractions_27tpp(
     if (NeedDstAcc == InteractionOut::NeedAcc)
         accumulator.atomicAddToDst(accumulator.get(), dstView, dstId);
 }
+
+/**
+ * One of the sources of the fused external interactions:
+ * view and cell-list of the source particles and the interaction
+ * functor (with possibly pair-specific parameters)
+ */
+template<typename Interaction>
+struct FusedSource
+{
+    typename Interaction::ViewType view;
+    CellListInfo cinfo;
+    Interaction interaction;
+};
+
+template<typename Interaction, int NSources>
+struct FusedSources
+{
+    FusedSource<Interaction> items[NSources];
+};
+
+/**
+ * Compute interactions between the particles of one ParticleVector
+ * and the particles of several other ParticleVector at once,
+ * equivalent to several computeExternalInteractions_1tpp() or
+ * computeExternalInteractions_3tpp() calls with InteractionMode::RowWise.
+ *
+ * The destination particle is read and its force is written only once
+ * for all the sources. All the functors must have the same cut-off radius.
+ *
+ * @tparam TPP number of threads per particle, 1 or 3
+ * @tparam NSources number of source particle vectors
+ */
+template<int TPP, int NSources, typename Interaction>
+__launch_bounds__(128, 16)
+__global__ void computeExternalInteractionsFused(
+        typename Interaction::ViewType dstView,
+        FusedSources<Interaction, NSources> sources, const float rc2)
+{
+    static_assert(TPP == 1 || TPP == 3, "Fused interactions support 1 or 3 threads per particle");
+
+    const int gid = blockIdx.x*blockDim.x + threadIdx.x;
+    const int dstId = gid / TPP;
+
+    if (dstId >= dstView.size) return;
+
+    const int dzBegin = (TPP == 1) ? -1 : gid % 3 - 1;
+    const int dzEnd   = (TPP == 1) ?  1 : dzBegin;
+
+    const auto dstP = sources.items[0].interaction.readNoCache(dstView, dstId);
+
+    auto accumulator = sources.items[0].interaction.getZeroedAccumulator();
+
+#pragma unroll
+    for (int s = 0; s < NSources; ++s)
+    {
+        auto& src = sources.items[s];
+        const int3 cell0 = src.cinfo.template getCellIdAlongAxes<CellListsProjection::NoClamp>(src.interaction.getPosition(dstP));
+
+        for (int cellZ = cell0.z + dzBegin; cellZ <= cell0.z + dzEnd; cellZ++)
+            for (int cellY = cell0.y-1; cellY <= cell0.y+1; cellY++)
+            {
+                if ( !(cellY >= 0 && cellY < src.cinfo.ncells.y && cellZ >= 0 && cellZ < src.cinfo.ncells.z) ) continue;
+
+                const int midCellId = src.cinfo.encode(cell0.x, cellY, cellZ);
+                int rowStart  = max(midCellId-1, 0);
+                int rowEnd    = min(midCellId+2, src.cinfo.totcells);
+
+                if (rowStart >= rowEnd) continue;
+
+                const int pstart = src.cinfo.cellStarts[rowStart];
+                const int pend   = src.cinfo.cellStarts[rowEnd];
+
+                computeCell<InteractionOut::NeedAcc, InteractionOut::NeedAcc, InteractionWith::Other>
+                    (pstart, pend, dstP, dstId, src.view, rc2, src.interaction, accumulator);
+            }
+    }
+
+    accumulator.atomicAddToDst(accumulator.get(), dstView, dstId);
+}
@@ -56,6 +56,12 @@ void BasicInteractionSDPD::halo(ParticleVector *pv1, ParticleVector *pv2,
     impl->halo(pv1, pv2, cl1, cl2, stream);
 }
 
+void BasicInteractionSDPD::localFused(ParticleVector *pv1, const std::vector<ParticleVector*>& pv2s,
+                                      CellList *cl1, const std::vector<CellList*>& cl2s, cudaStream_t stream)
+{
+    impl->localFused(pv1, pv2s, cl1, cl2s, stream);
+}
+
 
 
 
@@ -0,0 +1,345 @@
+#include "load_balancing.h"
+
+#include <core/logger.h>
+#include <core/pvs/extra_data/packers.h>
+#include <core/pvs/object_vector.h>
+#include <core/pvs/particle_vector.h>
+#include <core/pvs/restart_helpers.h>
+#include <core/pvs/views/ov.h>
+#include <core/utils/cuda_common.h>
+#include <core/utils/kernel_launch.h>
+
+#include <algorithm>
+
+namespace LoadBalancingKernels
+{
+
+__global__ void packParticles(int n, ParticlePacker packer, char *buffer, float3 shift)
+{
+    const int pid = blockIdx.x * blockDim.x + threadIdx.x;
+    if (pid >= n) return;
+
+    packer.packShift(pid, buffer + pid * packer.packedSize_byte, shift);
+}
+
+__global__ void unpackParticles(int n, ParticlePacker packer, const char *buffer, float3 shift)
+{
+    const int pid = blockIdx.x * blockDim.x + threadIdx.x;
+    if (pid >= n) return;
+
+    packer.unpack(buffer + pid * packer.packedSize_byte, pid);
+    packer.packShift(pid, packer, pid, shift);
+}
+
+// Objects are moved to global coordinates, periodically wrapped by their center of mass
+__global__ void packObjects(DomainInfo domain, OVview view, ObjectPacker packer, char *buffer)
+{
+    const int objId = blockIdx.x;
+    const int tid = threadIdx.x;
+
+    const float3 com = domain.local2global(view.comAndExtents[objId].com);
+    const float3 shift = domain.local2global(make_float3(0.0f)) - domain.globalSize * floorf(com / domain.globalSize);
+
+    char *dstAddr = buffer + packer.totalPackedSize_byte * objId;
+
+    for (int pid = tid; pid < view.objSize; pid += blockDim.x)
+    {
+        const int srcPid = objId * view.objSize + pid;
+        packer.part.packShift(srcPid, dstAddr + pid*packer.part.packedSize_byte, shift);
+    }
+
+    dstAddr += view.objSize * packer.part.packedSize_byte;
+    if (tid == 0) packer.obj.packShift(objId, dstAddr, shift);
+}
+
+__global__ void unpackObjects(OVview view, ObjectPacker packer, const char *buffer, float3 shift)
+{
+    const int objId = blockIdx.x;
+    const int tid = threadIdx.x;
+
+    const char *srcAddr = buffer + packer.totalPackedSize_byte * objId;
+
+    for (int pid = tid; pid < view.objSize; pid += blockDim.x)
+    {
+        const int dstPid = objId * view.objSize + pid;
+        packer.part.unpack(srcAddr + pid*packer.part.packedSize_byte, dstPid);
+        packer.part.packShift(dstPid, packer.part, dstPid, shift);
+    }
+
+    srcAddr += view.objSize * packer.part.packedSize_byte;
+    if (tid == 0)
+    {
+        packer.obj.unpack(srcAddr, objId);
+        packer.obj.packShift(objId, packer.obj, objId, shift);
+    }
+}
+
+} // namespace LoadBalancingKernels
+
+namespace LoadBalancing
+{
+
+static int histogramBin(float r, float size, int nbins)
+{
+    int bin = (int) floorf(r / size * nbins);
+    return std::min(std::max(bin, 0), nbins - 1);
+}
+
+/**
+ * Choose the planes separating ranks [rankBegin, rankEnd) within bins [binBegin, binEnd).
+ * prefix is the inclusive scan of the histogram, prefix[0] = 0
+ */
+static void bisect(const std::vector<long>& prefix, int binBegin, int binEnd,
+                   int rankBegin, int rankEnd, int minBins, std::vector<int>& planeBins)
+{
+    const int nranks = rankEnd - rankBegin;
+    if (nranks <= 1) return;
+
+    const int nleft  = nranks / 2;
+    const int nright = nranks - nleft;
+
+    // Minimize |L/nleft - R/nright|, i.e. the imbalance of the load per rank
+    int best = binBegin + nleft * minBins;
+    long bestDiff = -1;
+
+    for (int cut = binBegin + nleft * minBins; cut <= binEnd - nright * minBins; ++cut)
+    {
+        const long L = prefix[cut]    - prefix[binBegin];
+        const long R = prefix[binEnd] - prefix[cut];
+        const long diff = std::abs(L * nright - R * nleft);
+
+        if (bestDiff < 0 || diff < bestDiff)
+        {
+            best = cut;
+            bestDiff = diff;
+        }
+    }
+
+    planeBins[rankBegin + nleft] = best;
+
+    bisect(prefix, binBegin, best,   rankBegin,         rankBegin + nleft, minBins, planeBins);
+    bisect(prefix, best,     binEnd, rankBegin + nleft, rankEnd,           minBins, planeBins);
+}
+
+static std::vector<float> splitAxis(const std::vector<long>& histogram, int nranks, float size, float minSize, char axis)
+{
+    const int nbins = histogram.size();
+    const int minBins = std::max(1, (int) ceilf(minSize / size * nbins));
+
+    if (minBins * nranks > nbins)
+        die("Cannot split the domain along %c between %d ranks: subdomains would be smaller than %g",
+            axis, nranks, minSize);
+
+    std::vector<long> prefix(nbins + 1, 0);
+    for (int i = 0; i < nbins; ++i)
+        prefix[i+1] = prefix[i] + histogram[i];
+
+    std::vector<int> planeBins(nranks + 1);
+    planeBins[0]      = 0;
+    planeBins[nranks] = nbins;
+
+    bisect(prefix, 0, nbins, 0, nranks, minBins, planeBins);
+
+    std::vector<float> planes(nranks + 1);
+    for (int i = 0; i <= nranks; ++i)
+        planes[i] = planeBins[i] * size / nbins;
+
+    // exact boundaries
+    planes[0]      = 0.0f;
+    planes[nranks] = size;
+
+    return planes;
+}
+
+DomainSplit computeOrbSplit(MPI_Comm cartComm, const DomainInfo& domain,
+                            const std::vector<ParticleVector*>& pvs,
+                            float minSize, int nbins)
+{
+    int dims[3], periods[3], coords[3];
+    MPI_Check( MPI_Cart_get(cartComm, 3, dims, periods, coords) );
+
+    const int nbinsx = std::max(nbins, dims[0]);
+    const int nbinsy = std::max(nbins, dims[1]);
+    const int nbinsz = std::max(nbins, dims[2]);
+
+    std::vector<long> histogram(nbinsx + nbinsy + nbinsz, 0);
+    long *hx = histogram.data();
+    long *hy = hx + nbinsx;
+    long *hz = hy + nbinsy;
+
+    for (auto pv : pvs)
+    {
+        auto& coosvels = pv->local()->coosvels;
+        coosvels.downloadFromDevice(defaultStream, ContainersSynch::Synch);
+
+        for (const auto& p : coosvels)
+        {
+            const float3 r = domain.local2global(p.r);
+            hx[histogramBin(r.x, domain.globalSize.x, nbinsx)]++;
+            hy[histogramBin(r.y, domain.globalSize.y, nbinsy)]++;
+            hz[histogramBin(r.z, domain.globalSize.z, nbinsz)]++;
+        }
+    }
+
+    MPI_Check( MPI_Allreduce(MPI_IN_PLACE, histogram.data(), histogram.size(), MPI_LONG, MPI_SUM, cartComm) );
+
+    DomainSplit split;
+    split.x = splitAxis(std::vector<long>(hx, hx + nbinsx), dims[0], domain.globalSize.x, minSize, 'x');
+    split.y = splitAxis(std::vector<long>(hy, hy + nbinsy), dims[1], domain.globalSize.y, minSize, 'y');
+    split.z = splitAxis(std::vector<long>(hz, hz + nbinsz), dims[2], domain.globalSize.z, minSize, 'z');
+
+    return split;
+}
+
+static auto persistentPredicate = [] (const ExtraDataManager::NamedChannelDesc& namedDesc) {
+    return namedDesc.second->persistence == ExtraDataManager::PersistenceMode::Persistent;
+};
+
+static float wrapPeriodic(float r, float size)
+{
+    r -= size * floorf(r / size);
+    // round-off may put tiny negative values exactly at the upper boundary
+    if (r >= size) r = 0.0f;
+    return r;
+}
+
+// Returns -1 if the position is outside of the global domain or not finite
+static int getDestinationRank(MPI_Comm cartComm, const DomainSplit& split, float3 r)
+{
+    int3 rank3D = split.getRank3D(r);
+
+    if (rank3D.x >= (int) split.x.size() - 1 ||
+        rank3D.y >= (int) split.y.size() - 1 ||
+        rank3D.z >= (int) split.z.size() - 1)
+        return -1;
+
+    int rank;
+    MPI_Check( MPI_Cart_rank(cartComm, (int*)&rank3D, &rank) );
+    return rank;
+}
+
+static void redistributeParticles(MPI_Comm cartComm, const DomainInfo& oldDomain, const DomainSplit& newSplit, ParticleVector *pv)
+{
+    auto lpv = pv->local();
+    const int n = lpv->size();
+    const int nthreads = 128;
+
+    ParticlePacker packer(pv, lpv, persistentPredicate, defaultStream);
+    const int datumSize = packer.packedSize_byte;
+
+    PinnedBuffer<char> buffer(n * datumSize);
+    SAFE_KERNEL_LAUNCH(
+            LoadBalancingKernels::packParticles,
+            getNblocks(n, nthreads), nthreads, 0, defaultStream,
+            n, packer, buffer.devPtr(), oldDomain.local2global(make_float3(0.0f)) );
+
+    buffer.downloadFromDevice(defaultStream, ContainersSynch::Synch);
+
+    // particles may have left the global domain since the last redistribution, bring them back
+    std::vector<int> map(n);
+    for (int i = 0; i < n; ++i)
+    {
+        float3& r = reinterpret_cast<Particle*>(buffer.hostPtr() + i * datumSize)->r;
+        r.x = wrapPeriodic(r.x, oldDomain.globalSize.x);
+        r.y = wrapPeriodic(r.y, oldDomain.globalSize.y);
+        r.z = wrapPeriodic(r.z, oldDomain.globalSize.z);
+        map[i] = getDestinationRank(cartComm, newSplit, r);
+    }
+
+    const int nlost = std::count(map.begin(), map.end(), -1);
+    if (nlost > 0)
+        die("Cannot redistribute particle vector '%s': %d out of %d particles have invalid coordinates",
+            pv->name.c_str(), nlost, n);
+
+    std::vector<char> data(buffer.begin(), buffer.end());
+    RestartHelpers::exchangeData(cartComm, map, data, datumSize);
+
+    const int newn = data.size() / datumSize;
+    lpv->resize_anew(newn);
+
+    buffer.resize_anew(data.size());
+    std::copy(data.begin(), data.end(), buffer.begin());
+    buffer.uploadToDevice(defaultStream);
+
+    packer = ParticlePacker(pv, lpv, persistentPredicate, defaultStream);
+    SAFE_KERNEL_LAUNCH(
+            LoadBalancingKernels::unpackParticles,
+            getNblocks(newn, nthreads), nthreads, 0, defaultStream,
+            newn, packer, buffer.devPtr(), -pv->state->domain.local2global(make_float3(0.0f)) );
+
+    debug("Particle vector '%s' had %d particles, now has %d", pv->name.c_str(), n, newn);
+}
+
+static void redistributeObjects(MPI_Comm cartComm, const DomainInfo& oldDomain, const DomainSplit& newSplit, ObjectVector *ov)
+{
+    auto lov = ov->local();
+    const int nObjs = lov->nObjects;
+    const int nthreads = 128;
+
+    // Object vectors are not yet attached to any exchanger, compute the COMs explicitly
+    lov->comExtentValid = false;
+    ov->findExtentAndCOM(defaultStream, ParticleVectorType::Local);
+
+    ObjectPacker packer(ov, lov, persistentPredicate, defaultStream);
+    const int datumSize = packer.totalPackedSize_byte;
+    const int partSize  = packer.part.packedSize_byte;
+
+    PinnedBuffer<char> buffer(nObjs * datumSize);
+    SAFE_KERNEL_LAUNCH(
+            LoadBalancingKernels::packObjects,
+            nObjs, nthreads, 0, defaultStream,
+            oldDomain, OVview(ov, lov), packer, buffer.devPtr() );
+
+    buffer.downloadFromDevice(defaultStream, ContainersSynch::Synch);
+
+    std::vector<int> map(nObjs);
+    for (int i = 0; i < nObjs; ++i)
+    {
+        float3 com = make_float3(0.0f);
+        for (int j = 0; j < ov->objSize; ++j)
+            com += reinterpret_cast<const Particle*>(buffer.hostPtr() + i * datumSize + j * partSize)->r;
+        com /= ov->objSize;
+
+        // the objects were wrapped on the device, only protect against round-off here
+        com = fminf(fmaxf(com, make_float3(0.0f)), oldDomain.globalSize * (1.0f - 1e-6f));
+        map[i] = getDestinationRank(cartComm, newSplit, com);
+    }
+
+    const int nlost = std::count(map.begin(), map.end(), -1);
+    if (nlost > 0)
+        die("Cannot redistribute object vector '%s': %d out of %d objects have invalid centers of mass",
+            ov->name.c_str(), nlost, nObjs);
+
+    std::vector<char> data(buffer.begin(), buffer.end());
+    RestartHelpers::exchangeData(cartComm, map, data, datumSize);
+
+    const int newNObjs = data.size() / datumSize;
+    lov->resize_anew(newNObjs * ov->objSize);
+
+    buffer.resize_anew(data.size());
+    std::copy(data.begin(), data.end(), buffer.begin());
+    buffer.uploadToDevice(defaultStream);
+
+    packer = ObjectPacker(ov, lov, persistentPredicate, defaultStream);
+    SAFE_KERNEL_LAUNCH(
+            LoadBalancingKernels::unpackObjects,
+            newNObjs, nthreads, 0, defaultStream,
+            OVview(ov, lov), packer, buffer.devPtr(), -ov->state->domain.local2global(make_float3(0.0f)) );
+
+    lov->comExtentValid = false;
+
+    debug("Object vector '%s' had %d objects, now has %d", ov->name.c_str(), nObjs, newNObjs);
+}
+
+void redistribute(MPI_Comm cartComm, const DomainInfo& oldDomain, const DomainSplit& newSplit, ParticleVector *pv)
+{
+    auto ov = dynamic_cast<ObjectVector*>(pv);
+
+    if (ov == nullptr) redistributeParticles(cartComm, oldDomain, newSplit, pv);
+    else               redistributeObjects  (cartComm, oldDomain, newSplit, ov);
+
+    pv->cellListStamp++;
+    CUDA_Check( cudaDeviceSynchronize() );
+}
+
+} // namespace LoadBalancing
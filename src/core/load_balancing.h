@@ -0,0 +1,51 @@
+#pragma once
+
+#include "domain.h"
+
+#include <mpi.h>
+#include <vector>
+
+class ParticleVector;
+
+namespace LoadBalancing
+{
+
+/**
+ * Compute a non-uniform split of the domain such that all the ranks
+ * hold approximately the same number of particles.
+ *
+ * Particles of all the given particle vectors are binned into a coarse
+ * histogram along each axis (at least \p nbins bins per axis), the histograms
+ * are reduced over \p cartComm. Each axis is then split with recursive
+ * bisection: every cut is chosen to minimize the load imbalance between
+ * its two sides, accounting for the number of ranks on each side.
+ * Cuts are restricted to the bin boundaries, and each subdomain is at least
+ * \p minSize wide.
+ *
+ * The split is rectilinear (the planes are shared by all the ranks), which
+ * keeps the cartesian neighbourhood of the ranks intact.
+ *
+ * @param cartComm cartesian communicator of the simulation
+ * @param domain current domain decomposition, used to convert to global coordinates
+ * @param pvs particle vectors that define the load
+ * @param minSize minimum size of a subdomain along each axis
+ * @param nbins minimum number of histogram bins along each axis
+ */
+DomainSplit computeOrbSplit(MPI_Comm cartComm, const DomainInfo& domain,
+                            const std::vector<ParticleVector*>& pvs,
+                            float minSize, int nbins = 32);
+
+/**
+ * Move the local particles (or whole objects, for ObjectVectors) of \p pv,
+ * together with all their persistent channels, to the ranks owning them
+ * in the new decomposition \p newSplit. The new domain must already be set
+ * in the state of \p pv.
+ *
+ * @param cartComm cartesian communicator of the simulation
+ * @param oldDomain domain decomposition in which the particles are currently stored
+ * @param newSplit new decomposition of the domain
+ * @param pv particle vector to redistribute
+ */
+void redistribute(MPI_Comm cartComm, const DomainInfo& oldDomain, const DomainSplit& newSplit, ParticleVector *pv);
+
+} // namespace LoadBalancing
@@ -2,6 +2,7 @@
 
 #include <core/celllist.h>
 
+#include <algorithm>
 #include <set>
 
 static void insertClist(CellList *cl, std::vector<CellList*>& clists)
@@ -12,6 +13,10 @@ static void insertClist(CellList *cl, std::vector<CellList*>& clists)
         clists.push_back(cl);
 }
 
+InteractionManager::InteractionManager(bool fuseInteractions) :
+    fuseInteractions(fuseInteractions)
+{}
+
 void InteractionManager::add(Interaction *interaction, ParticleVector *pv1, ParticleVector *pv2, CellList *cl1, CellList *cl2)
 {
     auto intermediateOutput = interaction->getIntermediateOutputChannels();
@@ -241,8 +246,37 @@ std::vector<std::string> InteractionManager::_getExtraChannels(ParticleVector *p
 
 void InteractionManager::_executeLocal(std::vector<InteractionPrototype>& interactions, cudaStream_t stream)
 {
-    for (auto& p : interactions)
-        p.interaction->local(p.pv1, p.pv2, p.cl1, p.cl2, stream);
+    if (!fuseInteractions)
+    {
+        for (auto& p : interactions)
+            p.interaction->local(p.pv1, p.pv2, p.cl1, p.cl2, stream);
+        return;
+    }
+
+    // group by interaction and first PV, keep the order of the first appearance
+    std::vector<bool> done(interactions.size(), false);
+
+    for (size_t i = 0; i < interactions.size(); ++i)
+    {
+        if (done[i]) continue;
+
+        const auto& p = interactions[i];
+        std::vector<ParticleVector*> pv2s;
+        std::vector<CellList*> cl2s;
+
+        for (size_t j = i; j < interactions.size(); ++j)
+        {
+            const auto& q = interactions[j];
+            if (done[j] || q.interaction != p.interaction || q.pv1 != p.pv1 || q.cl1 != p.cl1)
+                continue;
+
+            pv2s.push_back(q.pv2);
+            cl2s.push_back(q.cl2);
+            done[j] = true;
+        }
+
+        p.interaction->localFused(p.pv1, pv2s, p.cl1, cl2s, stream);
+    }
 }
 
 void InteractionManager::_executeHalo(std::vector<InteractionPrototype>& interactions, cudaStream_t stream)
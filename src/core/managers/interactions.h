@@ -19,10 +19,15 @@ class CellList;
  *
  * This class is a managing clearing, gathering and accumulating the channels of the different cell lists.
  * It also wraps the execution of the interactions 
+ *
+ * If fusion is enabled, the local interactions that share the interaction handler and the first
+ * ParticleVector are executed together, see Interaction::localFused()
  */
 class InteractionManager
 {
 public:
+    InteractionManager(bool fuseInteractions = false);
+
     void add(Interaction *interaction, ParticleVector *pv1, ParticleVector *pv2, CellList *cl1, CellList *cl2);
     void check() const;
 
@@ -53,6 +58,8 @@ public:
 
 private:
 
+    bool fuseInteractions;
+
     using ChannelActivityList = std::vector<std::pair<std::string, Interaction::ActivePredicate>>;
     
     std::map<CellList*, ChannelActivityList> cellIntermediateOutputChannels;
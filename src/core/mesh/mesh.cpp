@@ -2,7 +2,12 @@
 
 #include <core/utils/cuda_common.h>
 
+#include <algorithm>
+#include <cstdlib>
 #include <fstream>
+#include <memory>
+#include <sys/stat.h>
+#include <unordered_map>
 #include <vector>
 
 Mesh::Mesh()
@@ -112,38 +117,157 @@ void Mesh::_check() const
     }
 }
 
-void Mesh::_readOff(std::string fname)
+namespace
+{
+struct OffData
+{
+    std::vector<float4> vertices;
+    std::vector<int3> triangles;
+
+    // to detect that the file was modified or replaced since it was parsed;
+    // the modification time is compared with nanoseconds, several writes may happen within a second
+    dev_t device;
+    ino_t inode;
+    struct timespec modificationTime;
+    off_t fileSize;
+
+    bool sameFile(const struct stat& fileStat) const
+    {
+        return device                   == fileStat.st_dev          &&
+               inode                    == fileStat.st_ino          &&
+               modificationTime.tv_sec  == fileStat.st_mtim.tv_sec  &&
+               modificationTime.tv_nsec == fileStat.st_mtim.tv_nsec &&
+               fileSize                 == fileStat.st_size;
+    }
+};
+
+// Meshes are often loaded from the same file several times (e.g. stress free and initial state,
+// or several membrane vectors), keep the parsed files for the whole run
+std::unordered_map< std::string, std::shared_ptr<const OffData> > offCache;
+
+class OffParser
+{
+public:
+    OffParser(std::string fname, const std::string& content) :
+        fname(fname),
+        ptr(content.c_str())
+    {}
+
+    void skipLine()
+    {
+        while (*ptr != '\0' && *ptr != '\n') ptr++;
+        if (*ptr == '\n') ptr++;
+    }
+
+    int readInt()
+    {
+        char *end;
+        long val = strtol(ptr, &end, 10);
+        if (end == ptr) fail();
+        ptr = end;
+        return val;
+    }
+
+    float readFloat()
+    {
+        char *end;
+        float val = strtof(ptr, &end);
+        if (end == ptr) fail();
+        ptr = end;
+        return val;
+    }
+
+private:
+    std::string fname;
+    const char *ptr;
+
+    void fail() const
+    {
+        die("Bad mesh file '%s': unexpected end of file or non-numeric value", fname.c_str());
+    }
+};
+} // anonymous namespace
+
+static std::shared_ptr<const OffData> parseOff(std::string fname, const struct stat& fileStat)
 {
-   std::ifstream fin(fname);
+    std::ifstream fin(fname, std::ios::binary);
     if (!fin.good())
         die("Mesh file '%s' not found", fname.c_str());
 
     debug("Reading mesh from file '%s'", fname.c_str());
 
-    std::string line;
-    std::getline(fin, line); // OFF header
+    // read the whole file at once, much faster than formatted stream input
+    std::string content(fileStat.st_size, '\0');
+    fin.read(&content[0], content.size());
 
-    int nedges;
-    fin >> nvertices >> ntriangles >> nedges;
-    std::getline(fin, line); // Finish with this line
+    auto data = std::make_shared<OffData>();
+    data->device           = fileStat.st_dev;
+    data->inode            = fileStat.st_ino;
+    data->modificationTime = fileStat.st_mtim;
+    data->fileSize         = fileStat.st_size;
+
+    OffParser parser(fname, content);
+    parser.skipLine(); // OFF header
+
+    int nvertices  = parser.readInt();
+    int ntriangles = parser.readInt();
+    parser.readInt(); // number of edges, unused
 
     // Read the vertex coordinates
-    vertexCoordinates.resize_anew(nvertices);
-    for (int i = 0; i < nvertices; i++)
-        fin >> vertexCoordinates[i].x >> vertexCoordinates[i].y >> vertexCoordinates[i].z;
+    data->vertices.resize(nvertices);
+    for (auto& v : data->vertices)
+    {
+        v.x = parser.readFloat();
+        v.y = parser.readFloat();
+        v.z = parser.readFloat();
+        v.w = 0.f;
+    }
 
     // Read the connectivity data
-    triangles.resize_anew(ntriangles);
+    data->triangles.resize(ntriangles);
     for (int i = 0; i < ntriangles; i++)
     {
-        int number;
-        fin >> number;
+        int number = parser.readInt();
         if (number != 3)
             die("Bad mesh file '%s' on line %d, number of face vertices is %d instead of 3",
                     fname.c_str(), 3 /* header */ + nvertices + i, number);
 
-        fin >> triangles[i].x >> triangles[i].y >> triangles[i].z;
+        auto& t = data->triangles[i];
+        t.x = parser.readInt();
+        t.y = parser.readInt();
+        t.z = parser.readInt();
+    }
+
+    return data;
+}
+
+void Mesh::_readOff(std::string fname)
+{
+    struct stat fileStat;
+    if (stat(fname.c_str(), &fileStat) != 0)
+        die("Mesh file '%s' not found", fname.c_str());
+
+    auto it = offCache.find(fname);
+
+    if (it == offCache.end() || !it->second->sameFile(fileStat))
+    {
+        offCache[fname] = parseOff(fname, fileStat);
+    }
+    else
+    {
+        debug("Reusing mesh already read from file '%s'", fname.c_str());
     }
+
+    const auto& data = *offCache[fname];
+
+    nvertices  = data.vertices.size();
+    ntriangles = data.triangles.size();
+
+    vertexCoordinates.resize_anew(nvertices);
+    triangles.resize_anew(ntriangles);
+
+    std::copy(data.vertices.begin(),  data.vertices.end(),  vertexCoordinates.begin());
+    std::copy(data.triangles.begin(), data.triangles.end(), triangles.begin());
 }
 
 
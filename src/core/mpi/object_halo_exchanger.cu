@@ -61,9 +61,7 @@ __global__ void getObjectHalos(const DomainInfo domain, const OVview view, const
 
         const int3 dir = FragmentMapping::getDir(bufId);
         
-        const float3 shift{ domain.localSize.x * dir.x,
-                            domain.localSize.y * dir.y,
-                            domain.localSize.z * dir.z };
+        const float3 shift = domain.neighbourShift(dir);
 
         __syncthreads();
         if (tid == 0)
@@ -41,9 +41,7 @@ __global__ void getExitingObjects(const DomainInfo domain, OVview view, const Ob
 
     __shared__ int shDstObjId;
 
-    const float3 shift{ domain.localSize.x * dx,
-                        domain.localSize.y * dy,
-                        domain.localSize.z * dz };
+    const float3 shift = domain.neighbourShift({dx, dy, dz});
 
     __syncthreads();
     if (tid == 0)
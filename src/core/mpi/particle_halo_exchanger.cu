@@ -19,14 +19,40 @@ enum class PackMode
     Query, Pack
 };
 
+/**
+ * Check if the particle is within the cutoff radius of the neighbouring subdomain in direction \p dir.
+ * The split is rectilinear, so the neighbour spans the same range as the current subdomain along
+ * the axes where the direction is 0.
+ */
+__device__ inline bool isCloseToNeighbour(const float4 *positions, int pid, int3 dir, float3 localSize, float rc2)
+{
+    Particle p;
+    p.readCoordinate(positions, pid);
+
+    auto distance = [] (float x, int d, float L) {
+        if (d == 0) return 0.0f;
+        return d > 0 ? max(0.5f*L - x, 0.0f) : max(x + 0.5f*L, 0.0f);
+    };
+
+    const float dx = distance(p.r.x, dir.x, localSize.x);
+    const float dy = distance(p.r.y, dir.y, localSize.y);
+    const float dz = distance(p.r.z, dir.z, localSize.z);
+
+    return dx*dx + dy*dy + dz*dz < rc2;
+}
+
 /**
  * Get halos
  * @param cinfo
+ * @param domain
  * @param packer
  * @param dataWrap
+ * @param positions if not nullptr, only the particles within cinfo.rc of the receiving
+ *        subdomain are sent; otherwise all the particles of the boundary cells are sent
  */
 template <PackMode packMode>
-__global__ void getHalos(const CellListInfo cinfo, const ParticlePacker packer, BufferOffsetsSizesWrap dataWrap)
+__global__ void getHalos(const CellListInfo cinfo, const DomainInfo domain, const ParticlePacker packer,
+                         BufferOffsetsSizesWrap dataWrap, const float4 *positions)
 {
     const int gid = blockIdx.x*blockDim.x + threadIdx.x;
     const int tid = threadIdx.x;
@@ -38,6 +64,8 @@ __global__ void getHalos(const CellListInfo cinfo, const ParticlePacker packer,
     int pstart = valid ? cinfo.cellStarts[cid]   : 0;
     int pend   = valid ? cinfo.cellStarts[cid+1] : 0;
 
+    const float rc2 = cinfo.rc * cinfo.rc;
+
     // Use shared memory to decrease number of global atomics
     // We're sending to max 7 halos (corner)
     short validHalos[7];
@@ -58,8 +86,17 @@ __global__ void getHalos(const CellListInfo cinfo, const ParticlePacker packer,
                 if (ix == 0 && iy == 0 && iz == 0) continue;
 
                 const int bufId = FragmentMapping::getId(ix, iy, iz);
+
+                int nSend = pend-pstart;
+                if (positions != nullptr)
+                {
+                    nSend = 0;
+                    for (int pid = pstart; pid < pend; pid++)
+                        nSend += isCloseToNeighbour(positions, pid, make_int3(ix, iy, iz), domain.localSize, rc2);
+                }
+
                 validHalos[current] = bufId;
-                haloOffset[current] = atomicAdd(blockSum + bufId, pend-pstart);
+                haloOffset[current] = atomicAdd(blockSum + bufId, nSend);
                 current++;
             }
 
@@ -82,19 +119,22 @@ __global__ void getHalos(const CellListInfo cinfo, const ParticlePacker packer,
 
             const int3 dir = FragmentMapping::getDir(bufId);
 
-            const float3 shift{ cinfo.localDomainSize.x * dir.x,
-                                cinfo.localDomainSize.y * dir.y,
-                                cinfo.localDomainSize.z * dir.z };
+            const float3 shift = domain.neighbourShift(dir);
+
+            int dstInd = myid;
 
 #pragma unroll 3
             for (int i = 0; i < pend-pstart; i++)
             {
-                const int dstInd = myid   + i;
                 const int srcInd = pstart + i;
 
+                if (positions != nullptr && !isCloseToNeighbour(positions, srcInd, dir, domain.localSize, rc2))
+                    continue;
+
                 auto bufferAddr = dataWrap.buffer + dataWrap.offsets[bufId]*packer.packedSize_byte;
 
                 packer.packShift(srcInd, bufferAddr + dstInd*packer.packedSize_byte, -shift);
+                dstInd++;
             }
         }
     }
@@ -113,6 +153,10 @@ __global__ static void unpackParticles(ParticlePacker packer, const char *buffer
 // Member functions
 //===============================================================================================
 
+ParticleHaloExchanger::ParticleHaloExchanger(bool filterByCutoff) :
+    filterByCutoff(filterByCutoff)
+{}
+
 ParticleHaloExchanger::~ParticleHaloExchanger() = default;
 
 void ParticleHaloExchanger::attach(ParticleVector *pv, CellList *cl, const std::vector<std::string>& extraChannelNames)
@@ -165,7 +209,8 @@ void ParticleHaloExchanger::prepareSizes(int id, cudaStream_t stream)
         SAFE_KERNEL_LAUNCH(
                 getHalos<PackMode::Query>,
                 nblocks, nthreads, 0, stream,
-                cl->cellInfo(), packer, helper->wrapSendData() );
+                cl->cellInfo(), pv->state->domain, packer, helper->wrapSendData(),
+                filterByCutoff ? reinterpret_cast<const float4*>(lpv->coosvels.devPtr()) : nullptr );
 
         helper->computeSendOffsets_Dev2Dev(stream);
     }
@@ -196,7 +241,8 @@ void ParticleHaloExchanger::prepareData(int id, cudaStream_t stream)
         SAFE_KERNEL_LAUNCH(
                 getHalos<PackMode::Pack>,
                 nblocks, nthreads, 0, stream,
-                cl->cellInfo(), packer, helper->wrapSendData() );
+                cl->cellInfo(), pv->state->domain, packer, helper->wrapSendData(),
+                filterByCutoff ? reinterpret_cast<const float4*>(lpv->coosvels.devPtr()) : nullptr );
     }
 }
 
@@ -14,6 +14,8 @@ private:
     std::vector<ParticleVector*> particles;
     std::vector<PackPredicate> packPredicates;
 
+    bool filterByCutoff;
+
     void prepareSizes(int id, cudaStream_t stream) override;
     void prepareData (int id, cudaStream_t stream) override;
     void combineAndUploadData(int id, cudaStream_t stream) override;
@@ -21,6 +23,13 @@ private:
 
 public:
 
+    /**
+     * @param filterByCutoff if true, only send the particles that are within the cell-list cutoff
+     *        of the receiving subdomain instead of all the particles of the boundary cells.
+     *        This reduces the amount of data sent, especially to the edge and corner neighbours,
+     *        but changes the order of the halo particles
+     */
+    ParticleHaloExchanger(bool filterByCutoff = false);
     ~ParticleHaloExchanger();
     
     void attach(ParticleVector *pv, CellList *cl, const std::vector<std::string>& extraChannelNames);
@@ -35,7 +35,7 @@ inline __device__ bool hasToLeave(int3 dir) {
 }
 
 template <PackMode packMode>
-__global__ void getExitingParticles(CellListInfo cinfo, PVview view, ParticlePacker packer, BufferOffsetsSizesWrap dataWrap)
+__global__ void getExitingParticles(CellListInfo cinfo, DomainInfo domain, PVview view, ParticlePacker packer, BufferOffsetsSizesWrap dataWrap)
 {
     const int gid = blockIdx.x*blockDim.x + threadIdx.x;
     int cid;
@@ -67,9 +67,7 @@ __global__ void getExitingParticles(CellListInfo cinfo, PVview view, ParticlePac
         
         if (hasToLeave(dir)) {
             const int bufId = FragmentMapping::getId(dir);
-            const float3 shift{ cinfo.localDomainSize.x * dir.x,
-                                cinfo.localDomainSize.y * dir.y,
-                                cinfo.localDomainSize.z * dir.z };
+            const float3 shift = domain.neighbourShift(dir);
 
             int myid = atomicAdd(dataWrap.sizes + bufId, 1);
 
@@ -150,7 +148,7 @@ void ParticleRedistributor::prepareSizes(int id, cudaStream_t stream)
         SAFE_KERNEL_LAUNCH(
                 ParticleRedistributorKernels::getExitingParticles<PackMode::Query>,
                 nblocks, nthreads, 0, stream,
-                cl->cellInfo(), cl->getView<PVview>(), packer, helper->wrapSendData() );
+                cl->cellInfo(), pv->state->domain, cl->getView<PVview>(), packer, helper->wrapSendData() );
 
         helper->computeSendOffsets_Dev2Dev(stream);
     }
@@ -179,7 +177,7 @@ void ParticleRedistributor::prepareData(int id, cudaStream_t stream)
         SAFE_KERNEL_LAUNCH(
                 ParticleRedistributorKernels::getExitingParticles<PackMode::Pack>,
                 nblocks, nthreads, 0, stream,
-                cl->cellInfo(), cl->getView<PVview>(), packer, helper->wrapSendData() );
+                cl->cellInfo(), pv->state->domain, cl->getView<PVview>(), packer, helper->wrapSendData() );
     }
 }
 
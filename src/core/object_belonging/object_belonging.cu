@@ -62,12 +62,36 @@ void ObjectBelongingChecker_Common::splitByBelonging(ParticleVector* src, Partic
     info("Splitting PV %s with respect to OV %s. Number of particles: in/out/total %d / %d / %d",
          src->name.c_str(), ov->name.c_str(), nInside[0], nOutside[0], src->local()->size());
 
-    // Need buffers because the source is the same as inside or outside
-    PinnedBuffer<Particle> bufIn(nInside[0]), bufOut(nOutside[0]);
+    // The number of particles on each side is known from the check above:
+    // the destinations are resized once to their final size and filled in place.
+    // A temporary buffer is only needed when the destination is the source itself
+    DeviceBuffer<Particle> bufIn, bufOut;
+
+    auto prepareDestination = [&] (ParticleVector *dst, ParticleVector *other, int n, DeviceBuffer<Particle>& buffer) -> Particle* {
+        if (dst == nullptr)
+            return nullptr;
+
+        if (dst == src || dst == other)
+        {
+            buffer.resize_anew(n);
+            return buffer.devPtr();
+        }
+
+        int oldSize = dst->local()->size();
+
+        if (oldSize == 0) dst->local()->resize_anew(n);
+        else              dst->local()->resize(oldSize + n, stream);
+
+        return dst->local()->coosvels.devPtr() + oldSize;
+    };
+
+    Particle *dstIn  = prepareDestination(pvIn,  pvOut, nInside [0], bufIn);
+    Particle *dstOut = prepareDestination(pvOut, pvIn,  nOutside[0], bufOut);
+
+    const int nIn = nInside[0], nOut = nOutside[0];
 
     nInside. clearDevice(stream);
     nOutside.clearDevice(stream);
-    tags.downloadFromDevice(stream);
 
     PVview view(src, src->local());
     const int nthreads = 128;
@@ -75,39 +99,38 @@ void ObjectBelongingChecker_Common::splitByBelonging(ParticleVector* src, Partic
             copyInOut,
             getNblocks(view.size, nthreads), nthreads, 0, stream,
             view,
-            tags.devPtr(), bufIn.devPtr(), bufOut.devPtr(),
+            tags.devPtr(), dstIn, dstOut,
             nInside.devPtr(), nOutside.devPtr() );
 
-    CUDA_Check( cudaStreamSynchronize(stream) );
+    auto copyFromBuffer = [&] (ParticleVector *dst, ParticleVector *other, int n, const DeviceBuffer<Particle>& buffer) {
+        if (dst == nullptr || (dst != src && dst != other))
+            return;
 
-    if (pvIn  != nullptr)
-    {
-        int oldSize = (src == pvIn) ? 0 : pvIn->local()->size();
-        pvIn->local()->resize(oldSize + nInside[0], stream);
+        int oldSize = (dst == src) ? 0 : dst->local()->size();
 
-        if (nInside[0] > 0)
-            CUDA_Check( cudaMemcpyAsync(pvIn->local()->coosvels.devPtr() + oldSize,
-                    bufIn.devPtr(),
-                    nInside[0] * sizeof(Particle),
+        if (oldSize == 0) dst->local()->resize_anew(n);
+        else              dst->local()->resize(oldSize + n, stream);
+
+        if (n > 0)
+            CUDA_Check( cudaMemcpyAsync(dst->local()->coosvels.devPtr() + oldSize,
+                    buffer.devPtr(),
+                    n * sizeof(Particle),
                     cudaMemcpyDeviceToDevice, stream) );
+    };
+
+    copyFromBuffer(pvIn,  pvOut, nIn,  bufIn);
+    copyFromBuffer(pvOut, pvIn,  nOut, bufOut);
 
+    CUDA_Check( cudaStreamSynchronize(stream) );
 
+    if (pvIn  != nullptr)
+    {
         info("New size of inner PV %s is %d", pvIn->name.c_str(), pvIn->local()->size());
         pvIn->cellListStamp++;
     }
 
     if (pvOut != nullptr)
     {
-        int oldSize = (src == pvOut) ? 0 : pvOut->local()->size();
-        pvOut->local()->resize(oldSize + nOutside[0], stream);
-
-        if (nOutside[0] > 0)
-            CUDA_Check( cudaMemcpyAsync(pvOut->local()->coosvels.devPtr() + oldSize,
-                    bufOut.devPtr(),
-                    nOutside[0] * sizeof(Particle),
-                    cudaMemcpyDeviceToDevice, stream) );
-
-
         info("New size of outer PV %s is %d", pvOut->name.c_str(), pvOut->local()->size());
         pvOut->cellListStamp++;
     }
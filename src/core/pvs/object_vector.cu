@@ -82,7 +82,9 @@ void ObjectVector::_getRestartExchangeMap(MPI_Comm comm, const std::vector<Parti
 
         com /= objSize;
 
-        int3 procId3 = make_int3(floorf(com / state->domain.localSize));
+        int3 procId3 = state->domainSplit.empty() ?
+            make_int3(floorf(com / state->domain.localSize)) :
+            state->domainSplit.getRank3D(com);
 
         if (procId3.x >= dims[0] || procId3.y >= dims[1] || procId3.z >= dims[2]) {
             map[i] = -1;
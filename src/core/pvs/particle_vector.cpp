@@ -315,7 +315,9 @@ void ParticleVector::_getRestartExchangeMap(MPI_Comm comm, const std::vector<Par
     
     for (int i = 0; i < parts.size(); ++i) {
         const auto& p = parts[i];
-        int3 procId3 = make_int3(floorf(p.r / state->domain.localSize));
+        int3 procId3 = state->domainSplit.empty() ?
+            make_int3(floorf(p.r / state->domain.localSize)) :
+            state->domainSplit.getRank3D(p.r);
 
         if (procId3.x >= dims[0] || procId3.y >= dims[1] || procId3.z >= dims[2]) {
             map[i] = -1;
@@ -54,6 +54,41 @@ struct PVviewWithDensities : public PVview
     }
 };
 
+/**
+ * Positions are additionally stored in 16-bit fixed point (x, y, z),
+ * covering the local domain extended by #margin on each side.
+ * Particles out of this range have w != 0 and undefined x, y, z.
+ * The encoding is done by the cell-list build (see CellList::build()),
+ * the compact positions are only valid for the localPV of a cell-list
+ * which requires them.
+ */
+struct PVviewWithCompactPositions : public PVview
+{
+    static constexpr float margin  = 1.0f;
+    static constexpr float maxCode = 65535.0f;
+
+    ushort4 *compactPositions = nullptr;
+    float3 compactOrigin {0.f, 0.f, 0.f};
+    float3 compactStep   {0.f, 0.f, 0.f};
+
+    PVviewWithCompactPositions(ParticleVector *pv = nullptr, LocalParticleVector *lpv = nullptr) :
+        PVview(pv, lpv)
+    {
+        if (lpv == nullptr) return;
+
+        compactPositions = lpv->extraPerParticle.getData<ushort4>(ChannelNames::compactPositions)->devPtr();
+
+        const float3 localSize = pv->state->domain.localSize;
+        compactOrigin = -0.5f * localSize - margin;
+        compactStep   = getCompactStep(localSize);
+    }
+
+    static inline float3 getCompactStep(float3 localSize)
+    {
+        return (localSize + 2.0f * margin) / maxCode;
+    }
+};
+
 template <typename BasicView> 
 struct PVviewWithStresses : public BasicView
 {
@@ -11,6 +11,8 @@ namespace RigidIntegrationKernels
 
 /**
  * Find total force and torque on objects, write it to motions
+ * One block per object, the partial sums of the warps are combined
+ * in shared memory such that only one atomic per object is performed
  */
 static __global__ void collectRigidForces(ROVview ovView)
 {
@@ -35,10 +37,31 @@ static __global__ void collectRigidForces(ROVview ovView)
         torque += cross(r, frc);
     }
 
-    force  = warpReduce( force,  [] (RigidReal a, RigidReal b) { return a+b; } );
-    torque = warpReduce( torque, [] (RigidReal a, RigidReal b) { return a+b; } );
+    auto sum = [] (RigidReal a, RigidReal b) { return a+b; };
+
+    force  = warpReduce( force,  sum );
+    torque = warpReduce( torque, sum );
+
+    __shared__ RigidReal3 warpForces[32], warpTorques[32];
+
+    const int wid = tid / warpSize;
+    const int nwarps = (blockDim.x + warpSize - 1) / warpSize;
 
     if ( __laneid() == 0 )
+    {
+        warpForces [wid] = force;
+        warpTorques[wid] = torque;
+    }
+
+    __syncthreads();
+
+    if (wid != 0) return;
+
+    const RigidReal3 zero {0,0,0};
+    force  = warpReduce( tid < nwarps ? warpForces [tid] : zero, sum );
+    torque = warpReduce( tid < nwarps ? warpTorques[tid] : zero, sum );
+
+    if (tid == 0)
     {
         atomicAdd(&ovView.motions[objId].force,  force);
         atomicAdd(&ovView.motions[objId].torque, torque);
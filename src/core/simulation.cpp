@@ -5,6 +5,7 @@
 #include <core/initial_conditions/interface.h>
 #include <core/integrators/interface.h>
 #include <core/interactions/interface.h>
+#include <core/load_balancing.h>
 #include <core/managers/interactions.h>
 #include <core/mpi/api.h>
 #include <core/object_belonging/interface.h>
@@ -78,16 +79,18 @@ struct SimulationTasks
 
 Simulation::Simulation(const MPI_Comm &cartComm, const MPI_Comm &interComm, YmrState *state,
                        int globalCheckpointEvery, std::string checkpointFolder,
-                       bool gpuAwareMPI)
+                       bool gpuAwareMPI, bool fuseInteractions, bool filterHalo)
     : nranks3D(nranks3D),
       interComm(interComm),
       state(state),
       globalCheckpointEvery(globalCheckpointEvery),
       checkpointFolder(checkpointFolder),
       gpuAwareMPI(gpuAwareMPI),
+      fuseInteractions(fuseInteractions),
+      filterHalo(filterHalo),
       scheduler(std::make_unique<TaskScheduler>()),
       tasks(std::make_unique<SimulationTasks>()),
-      interactionManager(std::make_unique<InteractionManager>())
+      interactionManager(std::make_unique<InteractionManager>(fuseInteractions))
 {
     int nranks[3], periods[3], coords[3];
 
@@ -680,8 +683,8 @@ std::vector<std::string> Simulation::getExtraDataToExchange(ObjectVector *ov)
 void Simulation::prepareEngines()
 {
     auto partRedistImp                  = std::make_unique<ParticleRedistributor>();
-    auto partHaloFinalImp               = std::make_unique<ParticleHaloExchanger>();
-    auto partHaloIntermediateImp        = std::make_unique<ParticleHaloExchanger>();
+    auto partHaloFinalImp               = std::make_unique<ParticleHaloExchanger>(filterHalo);
+    auto partHaloIntermediateImp        = std::make_unique<ParticleHaloExchanger>(filterHalo);
     auto objRedistImp                   = std::make_unique<ObjectRedistributor>();        
     auto objHaloFinalImp                = std::make_unique<ObjectHaloExchanger>();
     auto objHaloIntermediateImp         = std::make_unique<ObjectExtraExchanger>  (objHaloFinalImp.get());
@@ -1111,6 +1114,53 @@ static void buildDependencies(TaskScheduler *scheduler, SimulationTasks *tasks)
     scheduler->compile();
 }
 
+void Simulation::balanceDomain()
+{
+    if (!wallMap.empty())
+        die("Load balancing is not supported together with walls");
+
+    float minSize = 1.0f;
+    for (const auto& prototype : interactionPrototypes)
+        minSize = std::max(minSize, prototype.rc);
+
+    // objects are moved as a whole, a subdomain must be able to hold the largest one
+    float maxExtent = 0.0f;
+    for (auto ov : objectVectors)
+    {
+        auto lov = ov->local();
+
+        lov->comExtentValid = false;
+        ov->findExtentAndCOM(defaultStream, ParticleVectorType::Local);
+
+        auto comsExtents = lov->extraPerObject.getData<LocalObjectVector::COMandExtent>(ChannelNames::comExtents);
+        comsExtents->downloadFromDevice(defaultStream, ContainersSynch::Synch);
+
+        for (const auto& ce : *comsExtents)
+        {
+            const float3 extent = ce.high - ce.low;
+            maxExtent = std::max(maxExtent, std::max(extent.x, std::max(extent.y, extent.z)));
+        }
+    }
+    MPI_Check( MPI_Allreduce(MPI_IN_PLACE, &maxExtent, 1, MPI_FLOAT, MPI_MAX, cartComm) );
+    minSize = std::max(minSize, maxExtent);
+
+    info("Balancing the domain decomposition");
+
+    const DomainInfo oldDomain = state->domain;
+    auto split = LoadBalancing::computeOrbSplit(cartComm, oldDomain, getParticleVectors(), minSize);
+
+    state->domainSplit = split;
+    state->domain = createDomainInfo(cartComm, state->domain.globalSize, split);
+
+    for (auto pv : getParticleVectors())
+        LoadBalancing::redistribute(cartComm, oldDomain, split, pv);
+
+    info("Balanced subdomain size is [%f %f %f], subdomain starts "
+         "at [%f %f %f]",
+         state->domain.localSize.x, state->domain.localSize.y, state->domain.localSize.z,
+         state->domain.globalStart.x, state->domain.globalStart.y, state->domain.globalStart.z);
+}
+
 void Simulation::init()
 {
     info("Simulation initiated");
@@ -1262,6 +1312,12 @@ void Simulation::checkpoint()
     CUDA_Check( cudaDeviceSynchronize() );
 }
 
+std::unique_ptr<Simulation> Simulation::makeAuxiliarySimulation() const
+{
+    return std::make_unique<Simulation>(cartComm, MPI_COMM_NULL, state, 0, checkpointFolder,
+                                        gpuAwareMPI, fuseInteractions, filterHalo);
+}
+
 void Simulation::saveDependencyGraph_GraphML(std::string fname, bool current) const
 {
     if (rank != 0) return;
@@ -1272,12 +1328,17 @@ void Simulation::saveDependencyGraph_GraphML(std::string fname, bool current) co
     }
     else
     {
-        TaskScheduler s;
-        SimulationTasks t;
-        
-        createTasksDummy(&s, &t);
-        buildDependencies(&s, &t);
+        // The full graph only depends on the list of tasks, build it once
+        static const std::string fullGraph = [] () {
+            TaskScheduler s;
+            SimulationTasks t;
+
+            createTasksDummy(&s, &t);
+            buildDependencies(&s, &t);
+
+            return s.getDependencyGraph_GraphML();
+        }();
 
-        s.saveDependencyGraph_GraphML(fname);
+        TaskScheduler::saveGraphML(fname, fullGraph);
     }
 }
@@ -43,9 +43,17 @@ public:
 
     Simulation(const MPI_Comm &cartComm, const MPI_Comm &interComm, YmrState *state,
                int globalCheckpointEvery = 0, std::string checkpointFolder = "restart/",
-               bool gpuAwareMPI = false);
+               bool gpuAwareMPI = false, bool fuseInteractions = false, bool filterHalo = false);
 
     ~Simulation();
+
+    /**
+     * Create a simulation in the same domain, with the same communicator and
+     * the same performance options (GPU-aware MPI, fused interactions, halo filtering),
+     * but without checkpoints and postprocessing.
+     * Used to generate frozen particles.
+     */
+    std::unique_ptr<Simulation> makeAuxiliarySimulation() const;
     
     void restart(std::string folder);
     void checkpoint();
@@ -71,6 +79,7 @@ public:
             int checkEvery, int checkpointEvery=0);
 
 
+    void balanceDomain();
     void init();
     void run(int nsteps);
 
@@ -119,6 +128,8 @@ private:
     std::unique_ptr<InteractionManager> interactionManager;
 
     bool gpuAwareMPI;
+    bool fuseInteractions;
+    bool filterHalo;
 
     using ExchangeEngineUniquePtr = std::unique_ptr<ExchangeEngine>;
 
@@ -1,3 +1,4 @@
+#include <algorithm>
 #include <queue>
 #include <unistd.h>
 #include <sstream>
@@ -274,6 +275,20 @@ void TaskScheduler::run()
     int completed = 0;
     const int total = nodes.size();
 
+    auto resolveDependencies = [&S, &completed] (Node *node) {
+        for (auto dep : node->to)
+        {
+            if (!dep->from.empty())
+            {
+                dep->from.remove(node);
+                if (dep->from.empty())
+                    S.push(dep);
+            }
+        }
+
+        completed++;
+    };
+
     while (true)
     {
         // Check the status of all running kernels
@@ -292,18 +307,9 @@ void TaskScheduler::run()
                     node->streams->push(streamNode_it->first);
 
                     // Remove resolved dependencies
-                    for (auto dep : node->to)
-                    {
-                        if (!dep->from.empty())
-                        {
-                            dep->from.remove(node);
-                            if (dep->from.empty())
-                                S.push(dep);
-                        }
-                    }
+                    resolveDependencies(node);
 
                     // Remove task from the list of currently in progress
-                    completed++;
                     streamNode_it = workMap.erase(streamNode_it);
                 }
                 else if (result == cudaErrorNotReady)
@@ -324,6 +330,19 @@ void TaskScheduler::run()
         Node* node = S.top();
         S.pop();
 
+        auto& funcs = tasks[node->id].funcs;
+        const bool idle = std::none_of(funcs.begin(), funcs.end(), [this] (const std::pair<Function, int>& func_every) {
+            return nExecutions % func_every.second == 0;
+        });
+
+        // Nothing to launch at this step, no need to wait for a stream
+        if (idle)
+        {
+            debug("Skipping group %s", tasks[node->id].label.c_str());
+            resolveDependencies(node);
+            continue;
+        }
+
         cudaStream_t stream;
         if (node->streams->empty())
             CUDA_Check( cudaStreamCreateWithPriority(&stream, cudaStreamNonBlocking, node->priority) );
@@ -336,7 +355,7 @@ void TaskScheduler::run()
         debug("Executing group %s on stream %lld with priority %d", tasks[node->id].label.c_str(), (int64_t)stream, node->priority);
         workMap.push_back({stream, node});
 
-        for (auto& func_every : tasks[node->id].funcs)
+        for (auto& func_every : funcs)
             if (nExecutions % func_every.second == 0)
                 func_every.first(stream);
     }
@@ -363,7 +382,7 @@ static void add_edge(pugi::xml_node& graph, int sourceId, int targetId)
     edge.append_attribute("target") = std::to_string(targetId).c_str();
 }
 
-void TaskScheduler::saveDependencyGraph_GraphML(std::string fname) const
+std::string TaskScheduler::getDependencyGraph_GraphML() const
 {
     pugi::xml_document doc;
     auto root = doc.append_child("graphml");
@@ -396,6 +415,23 @@ void TaskScheduler::saveDependencyGraph_GraphML(std::string fname) const
             add_edge(graph, dep->id, n->id);
     }
 
-    auto filename = fname + ".graphml";    
-    doc.save_file(filename.c_str());
+    std::ostringstream out;
+    doc.save(out);
+    return out.str();
+}
+
+void TaskScheduler::saveDependencyGraph_GraphML(std::string fname) const
+{
+    saveGraphML(fname, getDependencyGraph_GraphML());
+}
+
+void TaskScheduler::saveGraphML(std::string fname, const std::string& graph)
+{
+    auto filename = fname + ".graphml";
+    std::ofstream fout(filename);
+
+    if (!fout.good())
+        error("Could not open file '%s' to save the dependency graph", filename.c_str());
+
+    fout << graph;
 }
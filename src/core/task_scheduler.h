@@ -36,6 +36,10 @@ public:
     void compile();
     void run();
     void saveDependencyGraph_GraphML(std::string fname) const;
+    std::string getDependencyGraph_GraphML() const;
+
+    /// write a graph obtained with getDependencyGraph_GraphML() to \p fname.graphml
+    static void saveGraphML(std::string fname, const std::string& graph);
 
     void forceExec(TaskID id, cudaStream_t stream);
 
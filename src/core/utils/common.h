@@ -10,6 +10,7 @@ static const std::string forces      = "forces";
 static const std::string stresses    = "stresses";
 static const std::string densities   = "densities";
 static const std::string oldParts    = "old_particles";
+static const std::string compactPositions = "compact_positions";
 
 // per object fields
 static const std::string motions     = "motions";
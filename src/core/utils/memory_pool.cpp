@@ -0,0 +1,214 @@
+#include "memory_pool.h"
+
+#include <core/logger.h>
+
+#include <algorithm>
+#include <cuda_runtime.h>
+
+static size_t roundUp(size_t n, size_t alignment)
+{
+    return alignment * ((n + alignment - 1) / alignment);
+}
+
+DeviceMemoryPool& DeviceMemoryPool::get()
+{
+    // Never destroyed: containers may still be freed at program exit,
+    // after the static objects are gone
+    static DeviceMemoryPool *pool = new DeviceMemoryPool();
+    return *pool;
+}
+
+void DeviceMemoryPool::init(size_t initialBytes, size_t maxBytes)
+{
+    if (maxBytes > 0 && initialBytes > maxBytes)
+        die("Initial size of the GPU memory pool (%zu bytes) is larger than the maximum size (%zu bytes)",
+            initialBytes, maxBytes);
+
+    release();
+
+    this->maxBytes = maxBytes;
+    enabled = (initialBytes > 0 || maxBytes > 0);
+
+    if (!enabled) return;
+
+    if (initialBytes > 0) grow(roundUp(initialBytes, alignment));
+
+    info("GPU memory pool enabled: initial size %zu bytes, maximum size %zu bytes (0 means unlimited)",
+         totalBytes, maxBytes);
+}
+
+void DeviceMemoryPool::release()
+{
+    if (!usedBlocks.empty())
+    {
+        size_t usedBytes = 0;
+        for (const auto& block : usedBlocks)
+            usedBytes += block.second;
+
+        die("Cannot release the GPU memory pool: %zu blocks (%zu bytes) are still in use",
+            usedBlocks.size(), usedBytes);
+    }
+
+    // the pending blocks may still be used by kernels or copies in flight
+    if (!chunkStarts.empty())
+        CUDA_Check( cudaDeviceSynchronize() );
+
+    for (auto chunk : chunkStarts)
+        CUDA_Check( cudaFree(chunk) );
+
+    if (totalBytes > 0)
+        debug("GPU memory pool released %zu bytes", totalBytes);
+
+    chunkStarts.clear();
+    freeByAddress.clear();
+    freeBySize.clear();
+    pendingBlocks.clear();
+
+    totalBytes = 0;
+    enabled = false;
+}
+
+bool DeviceMemoryPool::isEnabled() const
+{
+    return enabled;
+}
+
+void* DeviceMemoryPool::allocate(size_t bytes)
+{
+    if (!enabled)
+    {
+        void *ptr;
+        CUDA_Check( cudaMalloc(&ptr, bytes) );
+        return ptr;
+    }
+
+    const size_t size = roundUp(std::max(bytes, (size_t)1), alignment);
+    char *ptr = findFree(size);
+
+    if (ptr == nullptr && !pendingBlocks.empty())
+    {
+        CUDA_Check( cudaDeviceSynchronize() );
+        releasePending();
+        ptr = findFree(size);
+    }
+
+    if (ptr == nullptr)
+    {
+        grow(size);
+        ptr = findFree(size);
+    }
+
+    usedBlocks[ptr] = size;
+    return ptr;
+}
+
+void DeviceMemoryPool::deallocate(void *ptr)
+{
+    if (ptr == nullptr) return;
+
+    auto it = usedBlocks.find((char*)ptr);
+
+    // allocated before the pool was enabled
+    if (it == usedBlocks.end())
+    {
+        CUDA_Check( cudaFree(ptr) );
+        return;
+    }
+
+    pendingBlocks.push_back(*it);
+    usedBlocks.erase(it);
+}
+
+char* DeviceMemoryPool::findFree(size_t size)
+{
+    auto it = freeBySize.lower_bound(size);
+    if (it == freeBySize.end())
+        return nullptr;
+
+    char *ptr = it->second;
+    const size_t blockSize = it->first;
+
+    freeBySize.erase(it);
+    freeByAddress.erase(ptr);
+
+    if (blockSize > size)
+    {
+        freeByAddress[ptr + size] = blockSize - size;
+        freeBySize.insert({blockSize - size, ptr + size});
+    }
+
+    return ptr;
+}
+
+void DeviceMemoryPool::insertFree(char *ptr, size_t size)
+{
+    // merge with the next block, unless it belongs to another chunk
+    auto next = freeByAddress.find(ptr + size);
+    if (next != freeByAddress.end() && chunkStarts.find(next->first) == chunkStarts.end())
+    {
+        size += next->second;
+        eraseFree(next);
+    }
+
+    // merge with the previous block, unless this one starts a chunk
+    auto prev = freeByAddress.lower_bound(ptr);
+    if (prev != freeByAddress.begin() && chunkStarts.find(ptr) == chunkStarts.end())
+    {
+        --prev;
+        if (prev->first + prev->second == ptr)
+        {
+            ptr   = prev->first;
+            size += prev->second;
+            eraseFree(prev);
+        }
+    }
+
+    freeByAddress[ptr] = size;
+    freeBySize.insert({size, ptr});
+}
+
+void DeviceMemoryPool::eraseFree(FreeByAddress::iterator it)
+{
+    auto range = freeBySize.equal_range(it->second);
+    for (auto bs = range.first; bs != range.second; ++bs)
+        if (bs->second == it->first)
+        {
+            freeBySize.erase(bs);
+            break;
+        }
+
+    freeByAddress.erase(it);
+}
+
+void DeviceMemoryPool::releasePending()
+{
+    for (auto& block : pendingBlocks)
+        insertFree(block.first, block.second);
+
+    pendingBlocks.clear();
+}
+
+void DeviceMemoryPool::grow(size_t minSize)
+{
+    // grow by at least 20% of the current pool size to limit the number of chunks
+    size_t size = std::max(minSize, roundUp(totalBytes / 5, alignment));
+
+    if (maxBytes > 0)
+    {
+        if (totalBytes + minSize > maxBytes)
+            die("GPU memory pool is exhausted: requested %zu bytes, pool has %zu bytes out of maximum %zu",
+                minSize, totalBytes, maxBytes);
+
+        size = std::min(size, maxBytes - totalBytes);
+    }
+
+    char *ptr;
+    CUDA_Check( cudaMalloc(&ptr, size) );
+
+    chunkStarts.insert(ptr);
+    totalBytes += size;
+
+    insertFree(ptr, size);
+
+    debug("GPU memory pool grew by %zu bytes, total size is now %zu bytes", size, totalBytes);
+}
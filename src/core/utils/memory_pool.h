@@ -0,0 +1,77 @@
+#pragma once
+
+#include <cstddef>
+#include <map>
+#include <set>
+#include <utility>
+#include <vector>
+
+/**
+ * Pool of device memory used by all the GPU containers.
+ *
+ * The pool requests large chunks from cudaMalloc and sub-allocates them
+ * with best-fit strategy, adjacent free blocks are merged back together.
+ * The chunks are never returned to CUDA, so that repeated growth of
+ * the buffers does not fragment the device memory and does not
+ * synchronize the device on every allocation.
+ *
+ * Freed blocks may still be used by kernels or copies in flight,
+ * so they are only reused after the device has been synchronized.
+ * The synchronization is done lazily, when no other free block fits.
+ *
+ * If the pool is not enabled, plain cudaMalloc / cudaFree are used.
+ */
+class DeviceMemoryPool
+{
+public:
+    static DeviceMemoryPool& get();
+
+    /**
+     * Enable the pool and allocate the first chunk.
+     * Must be called after the device has been selected.
+     * The chunks of the previous initialization are released first, see release().
+     *
+     * @param initialBytes size of the first chunk, 0 to allocate on demand
+     * @param maxBytes total size the pool may grow to, 0 means no limit.
+     *                 The pool is disabled if both parameters are 0
+     */
+    void init(size_t initialBytes, size_t maxBytes);
+
+    /**
+     * Return all the chunks to CUDA and disable the pool.
+     * Dies if some blocks of the pool are still in use, as their owners
+     * would later free them into a pool that does not exist anymore.
+     * Must be called before the device is reset.
+     */
+    void release();
+
+    bool isEnabled() const;
+
+    void* allocate  (size_t bytes);
+    void  deallocate(void *ptr);
+
+private:
+    using FreeByAddress = std::map<char*, size_t>;
+    using FreeBySize    = std::multimap<size_t, char*>;
+
+    static const size_t alignment = 256;
+
+    bool enabled {false};
+    size_t totalBytes {0}, maxBytes {0};
+
+    std::set<char*> chunkStarts;
+
+    FreeByAddress freeByAddress;
+    FreeBySize    freeBySize;
+
+    std::map<char*, size_t> usedBlocks;
+    std::vector<std::pair<char*, size_t>> pendingBlocks;
+
+    DeviceMemoryPool() = default;
+
+    char* findFree(size_t size);
+    void insertFree(char *ptr, size_t size);
+    void eraseFree(FreeByAddress::iterator it);
+    void releasePending();
+    void grow(size_t minSize);
+};
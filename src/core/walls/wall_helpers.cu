@@ -10,6 +10,8 @@
 #include <core/xdmf/xdmf.h>
 
 #include <curand_kernel.h>
+#include <limits>
+#include <random>
 
 namespace WallHelpersKernels
 {
@@ -63,6 +65,43 @@ __global__ void initRandomPositions(int n, float3 *positions, long seed, float3
     positions[i] = r;
 }
 
+struct SobolDirections
+{
+    static constexpr int nbits = 32;
+    unsigned int v[3][nbits];
+    unsigned int shift[3];
+};
+
+/**
+ * Points of the 3D Sobol sequence with a random digital shift.
+ * Each point is computed directly from its index, so that
+ * the threads do not depend on each other.
+ */
+__global__ void initSobolPositions(int n, float3 *positions, SobolDirections directions, float3 localSize)
+{
+    const int i = blockIdx.x * blockDim.x + threadIdx.x;
+
+    if (i >= n) return;
+
+    unsigned int x[3];
+    for (int d = 0; d < 3; d++)
+        x[d] = directions.shift[d];
+
+    for (int k = 0; k < SobolDirections::nbits; k++)
+        if ((i >> k) & 1)
+            for (int d = 0; d < 3; d++)
+                x[d] ^= directions.v[d][k];
+
+    const float scale = 1.0f / 4294967296.0f; // 2^-32
+    float3 r;
+
+    r.x = localSize.x * (scale * x[0] - 0.5f);
+    r.y = localSize.y * (scale * x[1] - 0.5f);
+    r.z = localSize.z * (scale * x[2] - 0.5f);
+
+    positions[i] = r;
+}
+
 __global__ void countInside(int n, const float *sdf, int *nInside, float threshold = 0.f)
 {
     const int i = blockIdx.x * blockDim.x + threadIdx.x;
@@ -78,6 +117,43 @@ __global__ void countInside(int n, const float *sdf, int *nInside, float thresho
 }
 } // namespace WallHelpersKernels
 
+/**
+ * Direction numbers of the first 3 dimensions of the Sobol sequence,
+ * from primitive polynomials 1 (van der Corput), x + 1 and x^2 + x + 1
+ * (Joe and Kuo initial numbers)
+ */
+static WallHelpersKernels::SobolDirections computeSobolDirections(long seed)
+{
+    const int nbits = WallHelpersKernels::SobolDirections::nbits;
+    WallHelpersKernels::SobolDirections directions;
+
+    auto fill = [nbits] (unsigned int *v, int s, unsigned int a, std::vector<unsigned int> m) {
+        for (int k = s; k < nbits; k++)
+        {
+            unsigned int mk = m[k-s] ^ (m[k-s] << s);
+            for (int j = 1; j < s; j++)
+                if ((a >> (s-1-j)) & 1)
+                    mk ^= m[k-j] << j;
+            m.push_back(mk);
+        }
+        for (int k = 0; k < nbits; k++)
+            v[k] = m[k] << (nbits-1-k);
+    };
+
+    // van der Corput sequence: m_k = 1
+    for (int k = 0; k < nbits; k++)
+        directions.v[0][k] = 1u << (nbits-1-k);
+
+    fill(directions.v[1], 1, 0, {1});
+    fill(directions.v[2], 2, 1, {1, 3});
+
+    std::mt19937 gen(seed);
+    for (int d = 0; d < 3; d++)
+        directions.shift[d] = gen();
+
+    return directions;
+}
+
 static void extract_particles(ParticleVector *pv, const float *sdfs, float minVal, float maxVal)
 {
     PinnedBuffer<int> nFrozen(1);
@@ -189,9 +265,14 @@ void dumpWalls2XDMF(std::vector<SDF_basedWall*> walls, float3 gridH, DomainInfo
 }
 
 
-double volumeInsideWalls(std::vector<SDF_basedWall*> walls, DomainInfo domain, MPI_Comm comm, long nSamplesPerRank)
+double volumeInsideWalls(std::vector<SDF_basedWall*> walls, DomainInfo domain, MPI_Comm comm, long nSamplesPerRank, std::string method)
 {
     long n = nSamplesPerRank;
+
+    if (n > std::numeric_limits<int>::max())
+        die("Too many samples requested to compute the volume inside walls: %ld (maximum is %d)",
+            n, std::numeric_limits<int>::max());
+
     DeviceBuffer<float3> positions(n);
     DeviceBuffer<float> sdfs(n), sdfs_merged(n);
     PinnedBuffer<int> nInside(1);
@@ -200,10 +281,26 @@ double volumeInsideWalls(std::vector<SDF_basedWall*> walls, DomainInfo domain, M
     const int nblocks = getNblocks(n, nthreads);
     const float initial = -1e5;
 
-    SAFE_KERNEL_LAUNCH(
-        WallHelpersKernels::initRandomPositions,
-        nblocks, nthreads, 0, defaultStream,
-        n, positions.devPtr(), 424242, domain.localSize);
+    const long seed = 424242;
+
+    if (method == "mc")
+    {
+        SAFE_KERNEL_LAUNCH(
+            WallHelpersKernels::initRandomPositions,
+            nblocks, nthreads, 0, defaultStream,
+            n, positions.devPtr(), seed, domain.localSize);
+    }
+    else if (method == "sobol")
+    {
+        SAFE_KERNEL_LAUNCH(
+            WallHelpersKernels::initSobolPositions,
+            nblocks, nthreads, 0, defaultStream,
+            n, positions.devPtr(), computeSobolDirections(seed), domain.localSize);
+    }
+    else
+    {
+        die("Unknown method '%s' to compute the volume inside walls, expected 'mc' or 'sobol'", method.c_str());
+    }
 
     SAFE_KERNEL_LAUNCH(
         WallHelpersKernels::init_sdf,
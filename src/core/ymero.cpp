@@ -15,6 +15,7 @@
 #include <core/utils/cuda_common.h>
 #include <core/utils/folders.h>
 #include <core/utils/make_unique.h>
+#include <core/utils/memory_pool.h>
 #include <core/version.h>
 #include <core/walls/interface.h>
 #include <core/walls/simple_stationary_wall.h>
@@ -58,12 +59,17 @@ static void selectIntraNodeGPU(const MPI_Comm& source)
 }
 
 void YMeRo::init(int3 nranks3D, float3 globalDomainSize, float dt, std::string logFileName, int verbosity,
-                 int checkpointEvery, std::string checkpointFolder, bool gpuAwareMPI)
+                 int checkpointEvery, std::string checkpointFolder, bool gpuAwareMPI, std::string loadBalance,
+                 size_t gpuPoolInitialBytes, size_t gpuPoolMaxBytes, bool fuseInteractions, bool filterHalo)
 {
     int nranks;
     
     initLogger(comm, logFileName, verbosity);   
 
+    if      (loadBalance == "uniform") balanceLoad = false;
+    else if (loadBalance == "orb")     balanceLoad = true;
+    else die("Unknown load balancing strategy '%s', expected 'uniform' or 'orb'", loadBalance.c_str());
+
     MPI_Comm_set_errhandler(comm, MPI_ERRORS_RETURN);
 
     MPI_Check( MPI_Comm_size(comm, &nranks) );
@@ -78,12 +84,14 @@ void YMeRo::init(int3 nranks3D, float3 globalDomainSize, float dt, std::string l
     if (noPostprocess) {
         warn("No postprocess will be started now, use this mode for debugging. All the joint plugins will be turned off too.");
         
+        DeviceMemoryPool::get().release(); // chunks of a previous coordinator, before the device reset
         selectIntraNodeGPU(comm);
+        DeviceMemoryPool::get().init(gpuPoolInitialBytes, gpuPoolMaxBytes);
 
         createCartComm(comm, nranks3D, &cartComm);
         state = std::make_shared<YmrState> (createDomainInfo(cartComm, globalDomainSize), dt);
         sim = std::make_unique<Simulation> (cartComm, MPI_COMM_NULL, getState(),
-                                            checkpointEvery, checkpointFolder, gpuAwareMPI);
+                                            checkpointEvery, checkpointFolder, gpuAwareMPI, fuseInteractions, filterHalo);
         computeTask = 0;
         return;
     }
@@ -101,12 +109,14 @@ void YMeRo::init(int3 nranks3D, float3 globalDomainSize, float dt, std::string l
         MPI_Check( MPI_Intercomm_create(compComm, 0, comm, 1, 0, &interComm) );
 
         MPI_Check( MPI_Comm_rank(compComm, &rank) );
+        DeviceMemoryPool::get().release(); // chunks of a previous coordinator, before the device reset
         selectIntraNodeGPU(compComm);
+        DeviceMemoryPool::get().init(gpuPoolInitialBytes, gpuPoolMaxBytes);
 
         createCartComm(compComm, nranks3D, &cartComm);
         state = std::make_shared<YmrState> (createDomainInfo(cartComm, globalDomainSize), dt);
         sim = std::make_unique<Simulation> (cartComm, interComm, getState(),
-                                            checkpointEvery, checkpointFolder, gpuAwareMPI);
+                                            checkpointEvery, checkpointFolder, gpuAwareMPI, fuseInteractions, filterHalo);
     }
     else
     {
@@ -130,34 +140,43 @@ void YMeRo::initLogger(MPI_Comm comm, std::string logFileName, int verbosity)
 
 YMeRo::YMeRo(PyTypes::int3 nranks3D, PyTypes::float3 globalDomainSize, float dt,
              std::string logFileName, int verbosity, int checkpointEvery,
-             std::string checkpointFolder, bool gpuAwareMPI, bool noSplash) :
+             std::string checkpointFolder, bool gpuAwareMPI, bool noSplash,
+             std::string loadBalance, size_t gpuPoolInitialBytes, size_t gpuPoolMaxBytes,
+             bool fuseInteractions, bool filterHalo) :
     noSplash(noSplash)
 {
     MPI_Init(nullptr, nullptr);
     MPI_Comm_dup(MPI_COMM_WORLD, &comm);
     initializedMpi = true;
 
-    init( make_int3(nranks3D), make_float3(globalDomainSize), dt, logFileName, verbosity, checkpointEvery, checkpointFolder, gpuAwareMPI);
+    init( make_int3(nranks3D), make_float3(globalDomainSize), dt, logFileName, verbosity, checkpointEvery, checkpointFolder, gpuAwareMPI, loadBalance,
+          gpuPoolInitialBytes, gpuPoolMaxBytes, fuseInteractions, filterHalo);
 }
 
 YMeRo::YMeRo(long commAdress, PyTypes::int3 nranks3D, PyTypes::float3 globalDomainSize, float dt,
              std::string logFileName, int verbosity, int checkpointEvery, 
-             std::string checkpointFolder, bool gpuAwareMPI, bool noSplash) :
+             std::string checkpointFolder, bool gpuAwareMPI, bool noSplash,
+             std::string loadBalance, size_t gpuPoolInitialBytes, size_t gpuPoolMaxBytes,
+             bool fuseInteractions, bool filterHalo) :
     noSplash(noSplash)
 {
     // see https://stackoverflow.com/questions/49259704/pybind11-possible-to-use-mpi4py
     MPI_Comm comm = *((MPI_Comm*) commAdress);
     MPI_Comm_dup(comm, &this->comm);
-    init( make_int3(nranks3D), make_float3(globalDomainSize), dt, logFileName, verbosity, checkpointEvery, checkpointFolder, gpuAwareMPI);    
+    init( make_int3(nranks3D), make_float3(globalDomainSize), dt, logFileName, verbosity, checkpointEvery, checkpointFolder, gpuAwareMPI, loadBalance,
+          gpuPoolInitialBytes, gpuPoolMaxBytes, fuseInteractions, filterHalo);    
 }
 
 YMeRo::YMeRo(MPI_Comm comm, PyTypes::int3 nranks3D, PyTypes::float3 globalDomainSize, float dt,
              std::string logFileName, int verbosity, int checkpointEvery,
-             std::string checkpointFolder, bool gpuAwareMPI, bool noSplash) :
+             std::string checkpointFolder, bool gpuAwareMPI, bool noSplash,
+             std::string loadBalance, size_t gpuPoolInitialBytes, size_t gpuPoolMaxBytes,
+             bool fuseInteractions, bool filterHalo) :
     noSplash(noSplash)
 {
     MPI_Comm_dup(comm, &this->comm);
-    init( make_int3(nranks3D), make_float3(globalDomainSize), dt, logFileName, verbosity, checkpointEvery, checkpointFolder, gpuAwareMPI);
+    init( make_int3(nranks3D), make_float3(globalDomainSize), dt, logFileName, verbosity, checkpointEvery, checkpointFolder, gpuAwareMPI, loadBalance,
+          gpuPoolInitialBytes, gpuPoolMaxBytes, fuseInteractions, filterHalo);
 }
 
 static void safeCommFree(MPI_Comm *comm)
@@ -202,6 +221,9 @@ void YMeRo::registerInteraction(const std::shared_ptr<Interaction>& interaction)
 }
 void YMeRo::registerWall(const std::shared_ptr<Wall>& wall, int checkEvery)
 {
+    if (balanceLoad)
+        die("Walls are not supported with load balancing, use load_balance='uniform'");
+
     if (isComputeTask())
         sim->registerWall(wall, checkEvery);
 }
@@ -293,7 +315,7 @@ void YMeRo::dumpWalls2XDMF(std::vector<std::shared_ptr<Wall>> walls, PyTypes::fl
     ::dumpWalls2XDMF(sdfWalls, make_float3(h), state->domain, filename, sim->cartComm);
 }
 
-double YMeRo::computeVolumeInsideWalls(std::vector<std::shared_ptr<Wall>> walls, long nSamplesPerRank)
+double YMeRo::computeVolumeInsideWalls(std::vector<std::shared_ptr<Wall>> walls, long nSamplesPerRank, std::string method)
 {
     if (!isComputeTask()) return 0;
 
@@ -312,7 +334,7 @@ double YMeRo::computeVolumeInsideWalls(std::vector<std::shared_ptr<Wall>> walls,
         sim->getWallByNameOrDie(wall->name);
     }
 
-    return volumeInsideWalls(sdfWalls, state->domain, sim->cartComm, nSamplesPerRank);
+    return volumeInsideWalls(sdfWalls, state->domain, sim->cartComm, nSamplesPerRank, method);
 }
 
 std::shared_ptr<ParticleVector> YMeRo::makeFrozenWallParticles(std::string pvName,
@@ -348,27 +370,27 @@ std::shared_ptr<ParticleVector> YMeRo::makeFrozenWallParticles(std::string pvNam
 
     YmrState stateCpy = *getState();
     
-    Simulation wallsim(sim->cartComm, MPI_COMM_NULL, getState());
+    auto wallsim = sim->makeAuxiliarySimulation();
 
     float mass = 1.0;
     auto pv = std::make_shared<ParticleVector>(getState(), pvName, mass);
     auto ic = std::make_shared<UniformIC>(density);
     
-    wallsim.registerParticleVector(pv, ic, 0);
+    wallsim->registerParticleVector(pv, ic, 0);
     
-    wallsim.registerIntegrator(integrator);
+    wallsim->registerIntegrator(integrator);
     
-    wallsim.setIntegrator (integrator->name,  pv->name);
+    wallsim->setIntegrator (integrator->name,  pv->name);
 
     for (auto& interaction : interactions) {
-        wallsim.registerInteraction(interaction);        
-        wallsim.setInteraction(interaction->name, pv->name, pv->name);
+        wallsim->registerInteraction(interaction);        
+        wallsim->setInteraction(interaction->name, pv->name, pv->name);
     }
     
-    wallsim.init();
-    wallsim.run(nsteps);
+    wallsim->init();
+    wallsim->run(nsteps);
 
-    float effectiveCutoff = wallsim.getMaxEffectiveCutoff();
+    float effectiveCutoff = wallsim->getMaxEffectiveCutoff();
     
     const float wallThicknessTolerance = 0.2f;
     const float wallLevelSet = 0.0f;
@@ -414,37 +436,37 @@ std::shared_ptr<ParticleVector> YMeRo::makeFrozenRigidParticles(std::shared_ptr<
     YmrState stateCpy = *getState();
 
     {
-        Simulation eqsim(sim->cartComm, MPI_COMM_NULL, getState());
+        auto eqsim = sim->makeAuxiliarySimulation();
     
-        eqsim.registerParticleVector(pv, ic, 0);
+        eqsim->registerParticleVector(pv, ic, 0);
 
-        eqsim.registerIntegrator(integrator);
-        eqsim.setIntegrator (integrator->name,  pv->name);
+        eqsim->registerIntegrator(integrator);
+        eqsim->setIntegrator (integrator->name,  pv->name);
         
         for (auto& interaction : interactions) {
-            eqsim.registerInteraction(interaction);        
-            eqsim.setInteraction(interaction->name, pv->name, pv->name);
+            eqsim->registerInteraction(interaction);        
+            eqsim->setInteraction(interaction->name, pv->name, pv->name);
         }               
     
-        eqsim.init();
-        eqsim.run(nsteps);
+        eqsim->init();
+        eqsim->run(nsteps);
     }
 
-    Simulation freezesim(sim->cartComm, MPI_COMM_NULL, getState());
+    auto freezesim = sim->makeAuxiliarySimulation();
 
-    freezesim.registerParticleVector(pv, nullptr, 0);
-    freezesim.registerParticleVector(shape, icShape, 0);
-    freezesim.registerObjectBelongingChecker (checker);
-    freezesim.setObjectBelongingChecker(checker->name, shape->name);
-    freezesim.applyObjectBelongingChecker(checker->name, pv->name, insideName, pv->name, 0);
+    freezesim->registerParticleVector(pv, nullptr, 0);
+    freezesim->registerParticleVector(shape, icShape, 0);
+    freezesim->registerObjectBelongingChecker (checker);
+    freezesim->setObjectBelongingChecker(checker->name, shape->name);
+    freezesim->applyObjectBelongingChecker(checker->name, pv->name, insideName, pv->name, 0);
 
-    freezesim.init();
-    freezesim.run(1);
+    freezesim->init();
+    freezesim->run(1);
 
     // go back to initial state
     *state = stateCpy;
 
-    return freezesim.getSharedPVbyName(insideName);
+    return freezesim->getSharedPVbyName(insideName);
 }
 
 
@@ -542,6 +564,7 @@ void YMeRo::run(int nsteps)
     {
         if (!initialized)
         {
+            if (balanceLoad) sim->balanceDomain();
             sim->init();
             initialized = true;
         }
@@ -27,15 +27,21 @@ class YMeRo
 public:
     YMeRo(PyTypes::int3 nranks3D, PyTypes::float3 globalDomainSize, float dt,
           std::string logFileName, int verbosity, int checkpointEvery=0,
-          std::string checkpointFolder="restart/", bool gpuAwareMPI=false, bool noSplash=false);
+          std::string checkpointFolder="restart/", bool gpuAwareMPI=false, bool noSplash=false,
+          std::string loadBalance="uniform", size_t gpuPoolInitialBytes=0, size_t gpuPoolMaxBytes=0,
+          bool fuseInteractions=false, bool filterHalo=false);
 
     YMeRo(long commAddress, PyTypes::int3 nranks3D, PyTypes::float3 globalDomainSize, float dt,
           std::string logFileName, int verbosity, int checkpointEvery=0,
-          std::string checkpointFolder="restart/", bool gpuAwareMPI=false, bool noSplash=false);
+          std::string checkpointFolder="restart/", bool gpuAwareMPI=false, bool noSplash=false,
+          std::string loadBalance="uniform", size_t gpuPoolInitialBytes=0, size_t gpuPoolMaxBytes=0,
+          bool fuseInteractions=false, bool filterHalo=false);
 
     YMeRo(MPI_Comm comm, PyTypes::int3 nranks3D, PyTypes::float3 globalDomainSize, float dt,
           std::string logFileName, int verbosity, int checkpointEvery=0,
-          std::string checkpointFolder="restart/", bool gpuAwareMPI=false, bool noSplash=false);
+          std::string checkpointFolder="restart/", bool gpuAwareMPI=false, bool noSplash=false,
+          std::string loadBalance="uniform", size_t gpuPoolInitialBytes=0, size_t gpuPoolMaxBytes=0,
+          bool fuseInteractions=false, bool filterHalo=false);
 
     ~YMeRo();
     
@@ -70,7 +76,7 @@ public:
     std::shared_ptr<YmrState> getYmrState();
 
     void dumpWalls2XDMF(std::vector<std::shared_ptr<Wall>> walls, PyTypes::float3 h, std::string filename);
-    double computeVolumeInsideWalls(std::vector<std::shared_ptr<Wall>> walls, long nSamplesPerRank = 100000);
+    double computeVolumeInsideWalls(std::vector<std::shared_ptr<Wall>> walls, long nSamplesPerRank = 100000, std::string method = "mc");
     
     std::shared_ptr<ParticleVector> makeFrozenWallParticles(std::string pvName,
                                                             std::vector<std::shared_ptr<Wall>> walls,
@@ -101,6 +107,7 @@ private:
     int computeTask;
     bool noPostprocess;
     bool noSplash;
+    bool balanceLoad = false;
     
     bool initialized = false;
     bool initializedMpi = false;
@@ -112,7 +119,8 @@ private:
     MPI_Comm interComm {MPI_COMM_NULL}; ///< intercommunicator between postprocess and simulation
 
     void init(int3 nranks3D, float3 globalDomainSize, float dt, std::string logFileName, int verbosity,
-              int checkpointEvery, std::string restartFolder, bool gpuAwareMPI);
+              int checkpointEvery, std::string restartFolder, bool gpuAwareMPI, std::string loadBalance,
+              size_t gpuPoolInitialBytes, size_t gpuPoolMaxBytes, bool fuseInteractions, bool filterHalo);
     void initLogger(MPI_Comm comm, std::string logFileName, int verbosity);
     void sayHello();
 };
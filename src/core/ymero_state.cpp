@@ -25,6 +25,7 @@ YmrState::~YmrState() = default;
 void YmrState::swap(YmrState& other)
 {
     std::swap(domain,      other.domain);
+    std::swap(domainSplit, other.domainSplit);
     std::swap(dt,          other.dt);
     std::swap(currentTime, other.currentTime);
     std::swap(currentStep, other.currentStep);
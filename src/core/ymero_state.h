@@ -29,6 +29,7 @@ public:
 
 public:
     DomainInfo domain;
+    DomainSplit domainSplit;  ///< non-uniform decomposition of the domain, empty if uniform
 
     float dt;
     TimeType currentTime;
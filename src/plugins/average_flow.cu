@@ -70,6 +70,9 @@ void Average3D::setup(Simulation* simulation, const MPI_Comm& comm, const MPI_Co
     nranks3D = simulation->nranks3D;
     
     // TODO: this should be reworked if the domains are allowed to have different size
+    if (!state->domainSplit.empty())
+        die("Plugin '%s' requires uniform domain decomposition", name.c_str());
+
     resolution = make_int3( floorf(state->domain.localSize / binSize) );
     binSize = state->domain.localSize / make_float3(resolution);
 
@@ -46,12 +46,12 @@ void MeshPlugin::serializeAndSend(cudaStream_t stream)
 
     auto& mesh = ov->mesh;
 
-    waitPrevSend();
-    SimpleSerializer::serialize(sendBuffer, ov->name,
+    auto& buffer = nextSendBuffer();
+    SimpleSerializer::serialize(buffer, ov->name,
                                 mesh->getNvertices(), mesh->getNtriangles(), mesh->triangles,
                                 vertices);
 
-    send(sendBuffer);
+    send(buffer);
 }
 
 //=================================================================================
@@ -16,7 +16,6 @@ private:
     std::string ovName;
     int dumpEvery;
 
-    std::vector<char> sendBuffer;
     std::vector<float3> vertices;
     PinnedBuffer<Particle>* srcVerts;
 
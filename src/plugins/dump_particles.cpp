@@ -3,6 +3,7 @@
 
 #include <core/pvs/particle_vector.h>
 #include <core/simulation.h>
+#include <core/utils/common.h>
 #include <core/utils/folders.h>
 
 ParticleSenderPlugin::ParticleSenderPlugin(const YmrState *state, std::string name, std::string pvName, int dumpEvery,
@@ -20,6 +21,11 @@ void ParticleSenderPlugin::setup(Simulation* simulation, const MPI_Comm& comm, c
 
     pv = simulation->getPVbyNameOrDie(pvName);
 
+    for (int i = 0; i < channelNames.size(); ++i)
+        if (isForcesSnapshot(channelNames[i]) && channelTypes[i] != ChannelType::Vector)
+            die("Plugin '%s': channel '%s' holds the particle forces and must be dumped as a vector",
+                name.c_str(), channelNames[i].c_str());
+
     info("Plugin %s initialized for the following particle vector: %s", name.c_str(), pvName.c_str());
 }
 
@@ -45,32 +51,88 @@ void ParticleSenderPlugin::handshake()
     send(sendBuffer);
 }
 
-void ParticleSenderPlugin::beforeForces(cudaStream_t stream)
+bool ParticleSenderPlugin::isForcesSnapshot(const std::string& channelName) const
 {
-    if (state->currentStep % dumpEvery != 0 || state->currentStep == 0) return;
+    return channelName == ChannelNames::forces &&
+        !pv->local()->extraPerParticle.checkChannelExists(channelName);
+}
 
+bool ParticleSenderPlugin::hasForcesSnapshot() const
+{
+    for (const auto& name : channelNames)
+        if (isForcesSnapshot(name))
+            return true;
+    return false;
+}
+
+void ParticleSenderPlugin::downloadData(cudaStream_t stream)
+{
+    dumpTime = state->currentTime;
     particles.genericCopy(&pv->local()->coosvels, stream);
 
     for (int i = 0; i < channelNames.size(); ++i) {
         auto name = channelNames[i];
+
+        if (isForcesSnapshot(name)) {
+            // converted to the channel layout in serializeAndSend()
+            savedForces.genericCopy(&pv->local()->forces, stream);
+            continue;
+        }
+
         auto srcContainer = pv->local()->extraPerParticle.getGenericData(name);
         channelData[i].genericCopy(srcContainer, stream); 
     }
 }
 
+void ParticleSenderPlugin::beforeForces(cudaStream_t stream)
+{
+    if (state->currentStep % dumpEvery != 0 || state->currentStep == 0) return;
+    if (hasForcesSnapshot()) return;
+
+    downloadData(stream);
+}
+
+/**
+ * The total forces only exist from the force computation until the integration,
+ * and the particles are reordered by the next redistribution and cell-list build.
+ * All the data is thus downloaded here at the step before the dump,
+ * such that the forces are indexed the same way as the particles
+ */
+void ParticleSenderPlugin::beforeIntegration(cudaStream_t stream)
+{
+    if ((state->currentStep + 1) % dumpEvery != 0) return;
+    if (!hasForcesSnapshot()) return;
+
+    downloadData(stream);
+}
+
 void ParticleSenderPlugin::serializeAndSend(cudaStream_t stream)
 {
     if (state->currentStep % dumpEvery != 0 || state->currentStep == 0) return;
 
+    for (int i = 0; i < channelNames.size(); ++i) {
+        if (!isForcesSnapshot(channelNames[i])) continue;
+
+        if (savedForces.size() != particles.size())
+            die("Plugin '%s' downloaded %d forces for %d particles", name.c_str(), savedForces.size(), particles.size());
+
+        channelData[i].resize_anew(3 * savedForces.size());
+        for (int j = 0; j < savedForces.size(); ++j) {
+            channelData[i][3*j + 0] = savedForces[j].f.x;
+            channelData[i][3*j + 1] = savedForces[j].f.y;
+            channelData[i][3*j + 2] = savedForces[j].f.z;
+        }
+    }
+
     debug2("Plugin %s is sending now data", name.c_str());
     
     for (auto& p : particles)
         p.r = state->domain.local2global(p.r);
 
     debug2("Plugin %s is packing now data consisting of %d particles", name.c_str(), particles.size());
-    waitPrevSend();
-    SimpleSerializer::serialize(sendBuffer, state->currentTime, particles, channelData);
-    send(sendBuffer);
+    auto& buffer = nextSendBuffer();
+    SimpleSerializer::serialize(buffer, dumpTime, particles, channelData);
+    send(buffer);
 }
 
 
@@ -28,20 +28,29 @@ public:
     void handshake() override;
 
     void beforeForces(cudaStream_t stream) override;
+    void beforeIntegration(cudaStream_t stream) override;
     void serializeAndSend(cudaStream_t stream) override;
 
     bool needPostproc() override { return true; }
     
 protected:
+
+    /// "forces" channel not provided by another plugin: take it from the total forces
+    bool isForcesSnapshot(const std::string& channelName) const;
+    bool hasForcesSnapshot() const;
+    void downloadData(cudaStream_t stream);
+
     std::string pvName;
     ParticleVector *pv;
     
     int dumpEvery;
+    TimeType dumpTime {0};
 
     HostBuffer<Particle> particles;
     std::vector<std::string> channelNames;
     std::vector<ChannelType> channelTypes;
     std::vector<HostBuffer<float>> channelData;
+    HostBuffer<Force> savedForces;
 
     std::vector<char> sendBuffer;
 };
@@ -36,9 +36,9 @@ void XYZPlugin::serializeAndSend(cudaStream_t stream)
     for (auto& p : downloaded)
         p.r = state->domain.local2global(p.r);
 
-    waitPrevSend();
-    SimpleSerializer::serialize(sendBuffer, pv->name, downloaded);
-    send(sendBuffer);
+    auto& buffer = nextSendBuffer();
+    SimpleSerializer::serialize(buffer, pv->name, downloaded);
+    send(buffer);
 }
 
 //=================================================================================
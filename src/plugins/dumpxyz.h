@@ -15,8 +15,6 @@ private:
     std::string pvName;
     int dumpEvery;
 
-    std::vector<char> sendBuffer;
-
     ParticleVector* pv;
     
     HostBuffer<Particle> downloaded;
@@ -24,10 +24,14 @@ void Plugin::_setup(const MPI_Comm& comm, const MPI_Comm& interComm)
 
 SimulationPlugin::SimulationPlugin(const YmrState *state, std::string name) :
     Plugin(),
-    YmrSimulationObject(state, name),
-    sizeReq(MPI_REQUEST_NULL),
-    dataReq(MPI_REQUEST_NULL)
-{}
+    YmrSimulationObject(state, name)
+{
+    for (int i = 0; i < NumSendSlots; i++)
+    {
+        sizeReqs[i] = MPI_REQUEST_NULL;
+        dataReqs[i] = MPI_REQUEST_NULL;
+    }
+}
 
 SimulationPlugin::~SimulationPlugin() = default;
 
@@ -49,8 +53,7 @@ void SimulationPlugin::setup(Simulation* simulation, const MPI_Comm& comm, const
 void SimulationPlugin::finalize()
 {
     debug3("Plugin %s is finishing all the communications", name.c_str());
-    MPI_Check( MPI_Wait(&sizeReq, MPI_STATUS_IGNORE) );
-    MPI_Check( MPI_Wait(&dataReq, MPI_STATUS_IGNORE) );
+    waitPrevSend();
 }
 
 int SimulationPlugin::_tag()
@@ -58,12 +61,25 @@ int SimulationPlugin::_tag()
     return Plugin::_tag(name);
 }
 
+void SimulationPlugin::waitSlot(int slot)
+{
+    MPI_Check( MPI_Wait(&sizeReqs[slot], MPI_STATUS_IGNORE) );
+    MPI_Check( MPI_Wait(&dataReqs[slot], MPI_STATUS_IGNORE) );
+    sizeReqs[slot] = MPI_REQUEST_NULL;
+    dataReqs[slot] = MPI_REQUEST_NULL;
+}
+
 void SimulationPlugin::waitPrevSend()
 {
-    MPI_Check( MPI_Wait(&sizeReq, MPI_STATUS_IGNORE) );
-    MPI_Check( MPI_Wait(&dataReq, MPI_STATUS_IGNORE) );
-    sizeReq = MPI_REQUEST_NULL;
-    dataReq = MPI_REQUEST_NULL;
+    for (int i = 0; i < NumSendSlots; i++)
+        waitSlot(i);
+}
+
+std::vector<char>& SimulationPlugin::nextSendBuffer()
+{
+    int slot = (currentSlot + 1) % NumSendSlots;
+    waitSlot(slot);
+    return sendBuffers[slot];
 }
 
 void SimulationPlugin::send(const std::vector<char>& data)
@@ -73,15 +89,26 @@ void SimulationPlugin::send(const std::vector<char>& data)
 
 void SimulationPlugin::send(const void* data, int sizeInBytes)
 {
+    const int slot = (currentSlot + 1) % NumSendSlots;
+
+    // Buffers from nextSendBuffer() are only reused by every NumSendSlots message,
+    // any other buffer may still be used by one of the previous messages.
+    // Messages with the same tag are not overtaking each other,
+    // so the postprocess receives them in the order of sending
+    if (data != nullptr && data == sendBuffers[slot].data())
+        waitSlot(slot);
+    else
+        waitPrevSend();
+
+    currentSlot = slot;
+
     // So that async Isend of the size works on
     // valid address
-    localSendSize = sizeInBytes;
+    localSendSizes[currentSlot] = sizeInBytes;
 
-    waitPrevSend();
-        
     debug2("Plugin '%s' is sending the data (%d bytes)", name.c_str(), sizeInBytes);
-    MPI_Check( MPI_Issend(&localSendSize, 1, MPI_INT, rank, 2*_tag(), interComm, &sizeReq) );
-    MPI_Check( MPI_Issend(data, sizeInBytes, MPI_BYTE, rank, 2*_tag()+1, interComm, &dataReq) );
+    MPI_Check( MPI_Issend(&localSendSizes[currentSlot], 1, MPI_INT, rank, 2*_tag(), interComm, &sizeReqs[currentSlot]) );
+    MPI_Check( MPI_Issend(data, sizeInBytes, MPI_BYTE, rank, 2*_tag()+1, interComm, &dataReqs[currentSlot]) );
 }
 
 
@@ -50,14 +50,29 @@ public:
     virtual void finalize();    
 
 protected:
-    int localSendSize;
-    MPI_Request sizeReq, dataReq;
+    /// Number of messages to the postprocess that may be in flight at the same time
+    static const int NumSendSlots = 2;
+
+    int localSendSizes[NumSendSlots];
+    MPI_Request sizeReqs[NumSendSlots], dataReqs[NumSendSlots];
+    std::vector<char> sendBuffers[NumSendSlots];
+    int currentSlot {0};
 
     int _tag();
     
     void waitPrevSend();
     void send(const std::vector<char>& data);
     void send(const void* data, int sizeInBytes);
+
+    /**
+     * Get a buffer to serialize the data into, to be passed to send() right after.
+     * Only waits for the message sent from the same buffer NumSendSlots sends ago, so that
+     * the simulation can go on while the postprocess is still writing the previous dump.
+     */
+    std::vector<char>& nextSendBuffer();
+
+private:
+    void waitSlot(int slot);
 };
 
 
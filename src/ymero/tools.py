@@ -31,3 +31,23 @@ def eulerToQuaternion(pitch, roll, yaw):
          sy * cr * cp - cy * sr * sp]
 
     return q
+
+def load_coords(fname):
+    """
+    Returns a contiguous float32 array of shape (n, 3) with the coordinates stored in `fname`.
+    Files ending with `.npy` are memory-mapped, files ending with `.bin` are read
+    as raw float32 triplets; any other file is read as text with `numpy.loadtxt`
+    """
+    import os
+    import numpy as np
+
+    fname = os.fspath(fname)
+
+    if fname.endswith(".npy"):
+        coords = np.load(fname, mmap_mode='r')
+    elif fname.endswith(".bin"):
+        coords = np.fromfile(fname, dtype=np.float32)
+    else:
+        coords = np.loadtxt(fname, ndmin=2)
+
+    return np.ascontiguousarray(coords.reshape(-1, 3), dtype=np.float32)
@@ -33,7 +33,7 @@ com_q = [[2.0, 5.0, 5.0,   1.0, np.pi/2, np.pi/3, 0.0],
          [4.0, 4.0, 5.0,   1.0, np.pi/2, np.pi/3, 0.0],
          [6.0, 3.0, 5.0,   1.0, np.pi/2, np.pi/3, 0.0]]
 
-coords = np.loadtxt(args.coords).tolist()
+coords = np.loadtxt(args.coords).astype(np.float32)
 pvEllipsoid = ymr.ParticleVectors.RigidEllipsoidVector('ellipsoid', mass=1, object_size=len(coords), semi_axes=axes)
 icEllipsoid = ymr.InitialConditions.Rigid(com_q=com_q, coords=coords)
 vvEllipsoid = ymr.Integrators.RigidVelocityVerlet("ellvv")
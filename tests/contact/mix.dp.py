@@ -52,7 +52,7 @@ cnt = ymr.Interactions.LJ('cnt', 1.0, epsilon=0.35, sigma=0.8, max_force=400.0,
 prm_rbc = lina_parameters(1.0)    
 int_rbc = ymr.Interactions.MembraneForces("int_rbc", "wlc", "Kantor", **prm_rbc, stress_free=True)
 
-coords = np.loadtxt(args.coords).tolist()
+coords = np.loadtxt(args.coords).astype(np.float32)
 pv_ell = ymr.ParticleVectors.RigidEllipsoidVector('ellipsoid', mass=1, object_size=len(coords), semi_axes=args.axes)
 ic_ell = ymr.InitialConditions.Rigid(com_q=com_q_rig, coords=coords)
 vv_ell = ymr.Integrators.RigidVelocityVerlet("ellvv")
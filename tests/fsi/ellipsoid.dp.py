@@ -30,7 +30,7 @@ vv = ymr.Integrators.VelocityVerlet_withPeriodicForce('vv', force=a, direction="
 
 com_q = [[0.5 * domain[0], 0.5 * domain[1], 0.5 * domain[2],   1., 0, 0, 0]]
 
-coords = np.loadtxt(args.coords).tolist()
+coords = np.loadtxt(args.coords).astype(np.float32)
 pvEllipsoid = ymr.ParticleVectors.RigidEllipsoidVector('ellipsoid', mass=1, object_size=len(coords), semi_axes=axes)
 icEllipsoid = ymr.InitialConditions.Rigid(com_q=com_q, coords=coords)
 vvEllipsoid = ymr.Integrators.RigidVelocityVerlet("ellvv")
@@ -49,8 +49,6 @@ u.setInteraction(int_rbc, pv_rbc, pv_rbc)
 
 dump_every = 1
 
-u.registerPlugins(ymr.Plugins.createForceSaver("forceSaver", pv_rbc))
-
 u.registerPlugins(ymr.Plugins.createDumpParticlesWithMesh("meshdump",
                                                           pv_rbc,
                                                           dump_every,
@@ -55,7 +55,11 @@ if __name__ == '__main__':
     coords = createEllipsoid(args.density, args.axes, args.niter)
 
     if coords is not None:
-        np.savetxt(args.out, coords)
+        # binary output can be read back with ymero.tools.load_coords
+        if args.out.endswith(".npy"):
+            np.save(args.out, np.array(coords, dtype=np.float32))
+        else:
+            np.savetxt(args.out, coords)
     
 # TEST: rigids.createEllipsoid
 # set -eu
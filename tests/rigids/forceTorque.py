@@ -4,6 +4,8 @@ import ymero as ymr
 import numpy as np
 import argparse
 
+from ymero.tools import load_coords
+
 parser = argparse.ArgumentParser()
 parser.add_argument('--axes', dest='axes', type=float, nargs=3)
 parser.add_argument('--coords', dest='coords', type=str)
@@ -26,14 +28,14 @@ domain = (16, 8, 8)
 u = ymr.ymero(ranks, domain, dt, debug_level=3, log_filename='log')
 
 com_q = [[0.5 * domain[0], 0.5 * domain[1], 0.5 * domain[2],   1., 0, 0, 0]]
-coords = np.loadtxt(args.coords).tolist()
+coords = load_coords(args.coords)
 
 if args.withMesh:
     import trimesh
     ell = trimesh.creation.icosphere(subdivisions=2, radius = 1.0)
     for i in range(3):
         ell.vertices[:,i] *= axes[i]
-    mesh = ymr.ParticleVectors.Mesh(ell.vertices.tolist(), ell.faces.tolist())
+    mesh = ymr.ParticleVectors.Mesh(ell.vertices.astype(np.float32), ell.faces.astype(np.int32))
     pvEllipsoid = ymr.ParticleVectors.RigidEllipsoidVector('ellipsoid', mass=1, object_size=len(coords), semi_axes=axes, mesh=mesh)
 else:
     pvEllipsoid = ymr.ParticleVectors.RigidEllipsoidVector('ellipsoid', mass=1, object_size=len(coords), semi_axes=axes)
@@ -73,6 +75,16 @@ u.run(10000)
 # ymr.run --runargs "-n 2" ./forceTorque.py --axes $ax $ay $az --coords $f --constForce > /dev/null
 # cat stats/ellipsoid.txt | awk '{print $2, $10, $3}' > rigid.out.txt
 
+# nTEST: rigids.constForce.npy
+# set -eu
+# cd rigids
+# rm -rf stats rigid.out.txt
+# f="pos.npy"
+# rho=8.0; ax=2.0; ay=1.0; az=1.0
+# python -c "import numpy as np; np.save('$f', np.loadtxt('../../data/ellipsoid_coords_${rho}_${ax}_${ay}_${az}.txt'))"
+# ymr.run --runargs "-n 2" ./forceTorque.py --axes $ax $ay $az --coords $f --constForce > /dev/null
+# cat stats/ellipsoid.txt | awk '{print $2, $10, $3}' > rigid.out.txt
+
 # nTEST: rigids.constTorque
 # set -eu
 # cd rigids
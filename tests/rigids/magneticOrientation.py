@@ -22,14 +22,14 @@ domain = (16, 8, 8)
 u = ymr.ymero(ranks, domain, dt, debug_level=3, log_filename='log')
 
 com_q = [[0.5 * domain[0], 0.5 * domain[1], 0.5 * domain[2],   1., 0, 0, 0]]
-coords = np.loadtxt(args.coords).tolist()
+coords = np.loadtxt(args.coords).astype(np.float32)
 
 if args.withMesh:
     import trimesh
     ell = trimesh.creation.icosphere(subdivisions=2, radius = 1.0)
     for i in range(3):
         ell.vertices[:,i] *= axes[i]
-    mesh = ymr.ParticleVectors.Mesh(ell.vertices.tolist(), ell.faces.tolist())
+    mesh = ymr.ParticleVectors.Mesh(ell.vertices.astype(np.float32), ell.faces.astype(np.int32))
     pvEllipsoid = ymr.ParticleVectors.RigidEllipsoidVector('ellipsoid', mass=1, object_size=len(coords), semi_axes=axes, mesh=mesh)
 else:
     pvEllipsoid = ymr.ParticleVectors.RigidEllipsoidVector('ellipsoid', mass=1, object_size=len(coords), semi_axes=axes)
@@ -24,11 +24,11 @@ com_q = np.random.rand(args.nobjects, 7)
 com_q[:, 0:3] = np.multiply(com_q[:, 0:3], np.array(domain)) 
 vels  = np.random.rand(args.nobjects, 3)
 
-coords = np.loadtxt(args.coords).tolist()
+coords = np.loadtxt(args.coords).astype(np.float32)
 
 
 pvEllipsoid = ymr.ParticleVectors.RigidEllipsoidVector('ellipsoid', mass=1, object_size=len(coords), semi_axes=axes)
-icEllipsoid = ymr.InitialConditions.Rigid(com_q=com_q.tolist(), coords=coords, init_vels=vels.tolist())
+icEllipsoid = ymr.InitialConditions.Rigid(com_q=com_q, coords=coords, init_vels=vels)
 vvEllipsoid = ymr.Integrators.RigidVelocityVerlet("ellvv")
 
 u.registerParticleVector(pv=pvEllipsoid, ic=icEllipsoid)
@@ -35,7 +35,7 @@ vv = ymr.Integrators.VelocityVerlet_withPeriodicForce('vv', force=dp_force, dire
 
 com_q = [[args.xpos * domain[0], 0.5 * domain[1], 0.5 * domain[2],   1., 0, 0, 0]]
 
-coords = np.loadtxt(args.coords).tolist()
+coords = np.loadtxt(args.coords).astype(np.float32)
 
 pv_ell = ymr.ParticleVectors.RigidEllipsoidVector('ellipsoid', mass=1, object_size=len(coords), semi_axes=axes)
 ic_ell = ymr.InitialConditions.Rigid(com_q=com_q, coords=coords)
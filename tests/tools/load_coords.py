@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+import numpy as np
+import pathlib
+
+from ymero.tools import load_coords
+
+# exactly representable in text and in float32
+coords = np.arange(12, dtype=np.float32).reshape(4, 3) / 4
+
+np.savetxt("coords.txt", coords)
+np.save("coords.npy", coords)
+coords.tofile("coords.bin")
+
+# a single particle must still give a 2D array
+np.savetxt("single.txt", coords[:1])
+
+for fname in ["coords.txt", "coords.npy", "coords.bin", "single.txt"]:
+    for path in [fname, pathlib.Path(fname)]:
+        c = load_coords(path)
+
+        ref = coords[:len(c)]
+        assert c.dtype == np.float32
+        assert c.flags.c_contiguous
+        assert np.array_equal(c, ref)
+
+    print(fname, c.shape[0], c.shape[1], c.dtype)
+
+# TEST: tools.load_coords
+# cd tools
+# rm -rf coords.* single.txt
+# ./load_coords.py > coords.out.txt
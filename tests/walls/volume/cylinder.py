@@ -4,6 +4,10 @@ import argparse
 import numpy as np
 import ymero as ymr
 
+parser = argparse.ArgumentParser()
+parser.add_argument("--method", type = str, default = "mc")
+args = parser.parse_args()
+
 ranks  = (1, 1, 1)
 domain = (16, 16, 8)
 
@@ -14,7 +18,7 @@ wall = ymr.Walls.Cylinder("cylinder", center=center, radius=domain[1]*0.4, axis=
 
 u.registerWall(wall, 1000)
 
-volume = u.computeVolumeInsideWalls([wall], 100000)
+volume = u.computeVolumeInsideWalls([wall], 100000, method=args.method)
 
 np.savetxt("volume.txt", [volume]);
 
@@ -23,3 +27,9 @@ np.savetxt("volume.txt", [volume]);
 # rm -rf volume*txt
 # ymr.run --runargs "-n 1" ./cylinder.py > /dev/null
 # cp volume.txt volume.out.txt
+
+# nTEST: walls.volume.cylinder.sobol
+# cd walls/volume
+# rm -rf volume*txt
+# ymr.run --runargs "-n 1" ./cylinder.py --method sobol > /dev/null
+# cp volume.txt volume.out.txt
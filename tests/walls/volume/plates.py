@@ -6,6 +6,7 @@ import ymero as ymr
 
 parser = argparse.ArgumentParser()
 parser.add_argument("--D", type = float, required = True)
+parser.add_argument("--method", type = str, default = "mc")
 args = parser.parse_args()
 
 ranks  = (1, 1, 1)
@@ -19,7 +20,7 @@ plate_hi = ymr.Walls.Plane("plate_hi", normal=(0, 0,  1), pointThrough=(0, 0,  d
 u.registerWall(plate_lo, 1000)
 u.registerWall(plate_hi, 1000)
 
-volume = u.computeVolumeInsideWalls([plate_lo, plate_hi], 100000)
+volume = u.computeVolumeInsideWalls([plate_lo, plate_hi], 100000, method=args.method)
 
 np.savetxt("volume.txt", [volume]);
 
@@ -28,3 +29,9 @@ np.savetxt("volume.txt", [volume]);
 # rm -rf volume*txt
 # ymr.run --runargs "-n 1" ./plates.py --D 1.0 > /dev/null
 # cp volume.txt volume.out.txt
+
+# nTEST: walls.volume.plates.sobol
+# cd walls/volume
+# rm -rf volume*txt
+# ymr.run --runargs "-n 1" ./plates.py --D 1.0 --method sobol > /dev/null
+# cp volume.txt volume.out.txt
@@ -0,0 +1,147 @@
+#include <gtest/gtest.h>
+
+#include <core/logger.h>
+#include <core/utils/cuda_common.h>
+
+#include <cstdint>
+#include <map>
+#include <set>
+#include <vector>
+
+#define private public
+#include <core/utils/memory_pool.h>
+#undef private
+
+Logger logger;
+
+static const size_t KB = 1024;
+
+static bool isAligned(void *ptr)
+{
+    return reinterpret_cast<uintptr_t>(ptr) % DeviceMemoryPool::alignment == 0;
+}
+
+TEST(MemoryPool, AllocateFree)
+{
+    auto& pool = DeviceMemoryPool::get();
+    pool.init(64*KB, 0);
+
+    ASSERT_TRUE(pool.isEnabled());
+
+    void *a = pool.allocate(1000);
+    void *b = pool.allocate(1);
+
+    ASSERT_NE(a, nullptr);
+    ASSERT_NE(b, nullptr);
+    ASSERT_NE(a, b);
+    ASSERT_TRUE(isAligned(a));
+    ASSERT_TRUE(isAligned(b));
+
+    // the blocks must be usable device memory
+    CUDA_Check( cudaMemset(a, 0, 1000) );
+    CUDA_Check( cudaMemset(b, 0, 1) );
+    CUDA_Check( cudaDeviceSynchronize() );
+
+    ASSERT_EQ(pool.usedBlocks.size(), 2);
+
+    pool.deallocate(a);
+    pool.deallocate(b);
+
+    ASSERT_EQ(pool.usedBlocks.size(), 0);
+
+    pool.release();
+    ASSERT_FALSE(pool.isEnabled());
+    ASSERT_EQ(pool.totalBytes, 0);
+}
+
+TEST(MemoryPool, Reuse)
+{
+    auto& pool = DeviceMemoryPool::get();
+    pool.init(4*KB, 4*KB);
+
+    void *a = pool.allocate(4*KB);
+    pool.deallocate(a);
+
+    // the pool is full, the freed block must be reused once the device is synchronized
+    void *b = pool.allocate(4*KB);
+    ASSERT_EQ(a, b);
+    ASSERT_EQ(pool.chunkStarts.size(), 1);
+
+    // freed neighbours are merged back into a single block
+    pool.deallocate(b);
+    void *c1 = pool.allocate(1*KB);
+    void *c2 = pool.allocate(1*KB);
+    void *c3 = pool.allocate(2*KB);
+    pool.deallocate(c1);
+    pool.deallocate(c2);
+    pool.deallocate(c3);
+
+    void *d = pool.allocate(4*KB);
+    ASSERT_EQ(a, d);
+
+    pool.deallocate(d);
+    pool.release();
+}
+
+TEST(MemoryPool, Grow)
+{
+    auto& pool = DeviceMemoryPool::get();
+    pool.init(4*KB, 0);
+
+    void *a = pool.allocate(4*KB);
+    void *b = pool.allocate(16*KB);
+
+    ASSERT_NE(b, nullptr);
+    ASSERT_TRUE(isAligned(b));
+    ASSERT_EQ(pool.chunkStarts.size(), 2);
+    ASSERT_GE(pool.totalBytes, 20*KB);
+
+    CUDA_Check( cudaMemset(a, 0, 4*KB) );
+    CUDA_Check( cudaMemset(b, 0, 16*KB) );
+    CUDA_Check( cudaDeviceSynchronize() );
+
+    pool.deallocate(a);
+    pool.deallocate(b);
+
+    // blocks from different chunks are never merged
+    void *c = pool.allocate(20*KB);
+    ASSERT_EQ(pool.chunkStarts.size(), 3);
+
+    pool.deallocate(c);
+    pool.release();
+}
+
+TEST(MemoryPool, Reinit)
+{
+    auto& pool = DeviceMemoryPool::get();
+
+    pool.init(8*KB, 0);
+    void *a = pool.allocate(8*KB);
+    pool.deallocate(a);
+
+    // the chunks of the first initialization are returned to CUDA
+    pool.init(4*KB, 0);
+    ASSERT_EQ(pool.chunkStarts.size(), 1);
+    ASSERT_EQ(pool.totalBytes, 4*KB);
+
+    pool.init(0, 0);
+    ASSERT_FALSE(pool.isEnabled());
+    ASSERT_EQ(pool.chunkStarts.size(), 0);
+
+    // disabled pool falls back to plain cudaMalloc
+    void *b = pool.allocate(1*KB);
+    ASSERT_NE(b, nullptr);
+    pool.deallocate(b);
+}
+
+int main(int argc, char **argv)
+{
+    MPI_Init(&argc, &argv);
+    logger.init(MPI_COMM_WORLD, "memory_pool.log", 9);
+
+    testing::InitGoogleTest(&argc, argv);
+    auto ret = RUN_ALL_TESTS();
+
+    MPI_Finalize();
+    return ret;
+}